@@ -3,35 +3,52 @@
 from __future__ import annotations
 
 import os
+import sys
+import array
 import time
 import copy
-from typing import Callable, Literal, Any, Self, TypeAlias
+import json
+import bisect
+import mmap
+import shutil
+import operator
+import signal
+import contextlib
+import hashlib
+import graphlib
+from collections.abc import Sequence, Mapping, Iterator, Iterable
+from typing import TYPE_CHECKING, Callable, Literal, Any, Self, TypeAlias, overload
 
 
 this_dir = os.path.dirname(os.path.abspath(__file__))
 data_dir = os.path.join(os.path.dirname(this_dir), "data")
+cache_dir = os.path.join(os.path.dirname(this_dir), ".cache")
 
-# set the aoc session when missing
-if not os.getenv("AOC_SESSION", ""):
-    session_file = os.path.join(os.path.dirname(this_dir), ".aoc_session")
-    if os.path.exists(session_file):
-        with open(session_file) as f:
-            os.environ["AOC_SESSION"] = f.read().strip()
+session_file = os.path.join(os.path.dirname(this_dir), ".aoc_session")
+
+if TYPE_CHECKING:
+    import concurrent.futures
 
-import aocd
+    import numpy as np
+
+    import aocd
 
 
 Part = Literal["a", "b", "x"]
 
+# read-only view on input lines, shared between all solution calls
+Data: TypeAlias = Sequence[str]
+
 
 class Solver:
     """
     Puzzle solver class, helping with repeated tasks like input fetching and solution submission.
-    Requires the ``AOC_SESSION`` env var to be set. Use as:
+    Fetching inputs and submitting results requires the ``AOC_SESSION`` env var or a ``.aoc_session`` file in the
+    repository root, both of which are only read once the :py:attr:`puzzle` is accessed. Use as:
 
     .. code-block:: python
 
-        def solution(data: list[str], part: Part) -> int | None:
+        def solution(data: Data, part: Part) -> int | None:
             # return None to download input but skip result handling / submission, and integer otherwise
             return None
 
@@ -45,6 +62,9 @@ class Solver:
         day: int,
         truth_a: int | str | None = None,
         truth_b: int | str | None = None,
+        strip: bool = True,
+        strip_empty: bool = True,
+        parts: tuple[Literal["a", "b"], ...] = ("a", "b"),
     ) -> None:
         super().__init__()
 
@@ -53,13 +73,23 @@ class Solver:
         self.day = day
         self.truth_a = truth_a
         self.truth_b = truth_b
+        self.strip = strip
+        self.strip_empty = strip_empty
+        self.parts = parts
 
         # deferred aocd puzzle handle
         self._puzzle: aocd.models.Puzzle | None = None
 
+        # loaded input lines and parsed inputs, shared between parts
+        self._lines: dict[tuple[str, bool, bool], Lines] = {}
+        self._parsed: dict[tuple[Callable, int], tuple[Data, Any, float]] = {}
+
     @property
     def puzzle(self) -> aocd.models.Puzzle:
         if self._puzzle is None:
+            # lazy import as aocd and its dependencies take long to load and are only needed for remote access
+            load_session()
+            import aocd
             self._puzzle = aocd.get_puzzle(year=self.year, day=self.day)
         return self._puzzle
 
@@ -69,59 +99,237 @@ class Solver:
 
     @property
     def has_session(self) -> bool:
-        return bool(os.getenv("AOC_SESSION", ""))
+        return load_session()
 
     def __call__(self, *args, **kwargs) -> None:
         return self.solve(*args, **kwargs)
 
+    def load(
+        self,
+        *,
+        example: int | bool = False,
+        strip: bool | None = None,
+        strip_empty: bool | None = None,
+    ) -> Lines:
+        """
+        Returns the input lines from the local data file, which is fetched via aocd first if missing. Lines are
+        memory-mapped and split lazily (see :py:class:`Lines`), and reused for subsequent calls. *strip* and
+        *strip_empty* default to the values passed to the constructor.
+        """
+        if strip is None:
+            strip = self.strip
+        if strip_empty is None:
+            strip_empty = self.strip_empty
+
+        # get example index if set
+        example_index = 0
+        if not isinstance(example, bool):
+            example_index = example
+            example = True
+
+        # fetch data from local file, fallback to aocd
+        data_name = f"example{example_index or ''}" if example else "data"
+        data_name = f"{data_name}{self.day:02d}.txt"
+        data_path = os.path.join(data_dir, data_name)
+        if not os.path.exists(data_path):
+            data_raw = (self.puzzle.examples[example_index] if example else self.puzzle).input_data
+            with open(data_path, "w") as f:
+                f.write(data_raw)
+
+        # map into memory and split into lines lazily, reusing lines loaded for other parts
+        lines_key = (data_path, strip, strip_empty)
+        if lines_key not in self._lines:
+            self._lines[lines_key] = Lines(data_path, strip=strip, strip_empty=strip_empty)
+
+        return self._lines[lines_key]
+
+    def parse(self, parse: Callable[[Data], Any], data: Data) -> tuple[Any, float, bool]:
+        """
+        Runs *parse* on *data* once and caches the result for subsequent calls with the same objects. Returns the
+        parsed input, the parsing runtime and whether the result was taken from the cache.
+        """
+        key = (parse, id(data))
+        if key in self._parsed:
+            _, parsed, runtime = self._parsed[key]
+            return parsed, runtime, True
+
+        t1 = time.perf_counter()
+        parsed = parse(data)
+        runtime = time.perf_counter() - t1
+
+        # keep a reference to data so that its id cannot be reused
+        self._parsed[key] = (data, parsed, runtime)
+
+        return parsed, runtime, False
+
     def solve(
         self,
         func:
-            Callable[[list[str], Part], int | str | None] |
-            tuple[Callable[[list[str]], int | str | None], Callable[[list[str]], int | str | None]],
+            Callable[[Data, Part], int | str | None] |
+            tuple[Callable[[Data], int | str | None], Callable[[Data], int | str | None]] |
+            Callable[[Any, Part], int | str | None],
         /,
         *,
         part: Part,
         submit: bool = True,
         example: int | bool = False,
-        strip: bool = True,
-        strip_empty: bool = True,
-        data: list[str] | None = None,
+        strip: bool | None = None,
+        strip_empty: bool | None = None,
+        mutable: bool = False,
+        parse: Callable[[Data], Any] | None = None,
+        parallel: bool = False,
+        cache: bool = False,
+        data: Data | None = None,
+        profile: Literal["cprofile", "tracemalloc", "lines"] | None = None,
+        profile_dir: str | None = None,
+        timeout: float | None = None,
+        max_memory: int | None = None,
     ) -> None:
+        """
+        Solves *part* of the puzzle with the solution *func* (or a 2-tuple of functions for parts a and b), or all
+        its :py:attr:`parts` for ``part="x"``. Input lines (see :py:meth:`load`) are passed as an immutable sequence
+        that is shared between all calls without copying, unless *mutable* is set, in which case each call receives
+        a fresh list that it is free to modify.
+
+        When *parse* is given, the solution follows a two-phase protocol: *parse* is called with the input lines
+        once, and its cached result is passed to *func* instead of the lines for all parts. With *mutable*, each call
+        receives a deep copy of the parsed input.
+
+        With *parallel*, both parts of ``part="x"`` are solved concurrently in two worker processes, while results
+        are still printed in order.
+
+        With *cache*, results are looked up in and stored to the on-disk :py:data:`result_cache`, which is invalidated
+        by changes to the input or the solution code.
+
+        With *profile*, each solution call is profiled in the current process (see :py:class:`Profiler`) and a
+        summary is printed below its runtime, bypassing cached results. When *profile_dir* is set, the full profile
+        of each part is dumped there, too. Phases marked with :py:func:`span` are always shown as sub-timings.
+
+        *timeout* (in seconds) and *max_memory* (in bytes) abort runaway solutions (see :py:func:`limit`). In any
+        case, the elapsed time is reported when a solution fails.
+        """
         assert part in {"a", "b", "x"}
+        if profile is not None and profile not in Profiler.modes:
+            raise ValueError(f"unknown profile mode '{profile}', expected one of {', '.join(Profiler.modes)}")
+        if profile is not None and parallel:
+            raise ValueError("profiling is not supported in parallel mode")
 
         # get example index if set
-        example_orig = example
         example_index = 0
         if not isinstance(example, bool):
             example_index = example
             example = True
 
-        # fetch data from local file, fallback to aocd
+        # fetch data
         if data is None:
-            data_name = f"example{example_index or ''}" if example else "data"
-            data_name = f"{data_name}{self.day:02d}.txt"
-            data_path = os.path.join(data_dir, data_name)
-            if os.path.exists(data_path):
-                with open(data_path, "r") as f:
-                    data_raw = f.read()
-            else:
-                data_raw = (self.puzzle.examples[example_index] if example else self.puzzle).input_data
-                with open(data_path, "w") as f:
-                    f.write(data_raw)
-
-            # split into lines
-            data = data_raw.splitlines()
-            if strip:
-                data = [line for line in (line.strip() for line in data) if not strip_empty or line]
-
-        # solve both parts when "x" is given
-        if part == "x":
-            self.solve(func, part="a", submit=submit, example=example_orig, data=data)
-            print("")
-            self.solve(func, part="b", submit=submit, example=example_orig, data=data)
-            return
-
+            data = self.load(example=example_index if example else False, strip=strip, strip_empty=strip_empty)
+        elif not isinstance(data, (tuple, Lines)):
+            data = tuple(data)
+
+        # solve all parts when "x" is given
+        parts: list[Literal["a", "b"]] = list(self.parts) if part == "x" else [part]
+        outcomes: dict[str, concurrent.futures.Future[tuple[Any, float, dict[str, float]]]] = {}
+        parsed: tuple[Any, float, bool, dict[str, float]] | None = None
+        compute_parts: list[Literal["a", "b"]] = []
+        if parallel and len(parts) > 1:
+            # only compute parts that are not cached
+            compute_parts = [
+                _part for _part in parts
+                if not cache or result_cache.get(result_cache.key(func, _part, data, parse=parse)) is None
+            ]
+            if compute_parts:
+                outcomes, parsed = self._submit_parallel(
+                    func,
+                    compute_parts,
+                    data,
+                    parse=parse,
+                    mutable=mutable,
+                    timeout=timeout,
+                    max_memory=max_memory,
+                )
+        for i, _part in enumerate(parts):
+            if i:
+                print("")
+            self._solve_part(
+                func,
+                _part,
+                data,
+                submit=submit,
+                example=example,
+                example_index=example_index,
+                mutable=mutable,
+                parse=parse,
+                cache=cache,
+                profile=profile,
+                profile_dir=profile_dir,
+                timeout=timeout,
+                max_memory=max_memory,
+                outcome=outcomes.get(_part),
+                parsed=parsed if compute_parts and _part == compute_parts[0] else None,
+            )
+
+    def _submit_parallel(
+        self,
+        func: Callable | tuple[Callable, Callable],
+        parts: list[Literal["a", "b"]],
+        data: Data,
+        *,
+        parse: Callable[[Data], Any] | None = None,
+        mutable: bool = False,
+        timeout: float | None = None,
+        max_memory: int | None = None,
+    ) -> tuple[
+        dict[str, concurrent.futures.Future[tuple[Any, float, dict[str, float]]]],
+        tuple[Any, float, bool, dict[str, float]] | None,
+    ]:
+        # parse once upfront so that workers inherit the parsed input, and keep its outcome for reporting
+        inp: Any = data
+        parsed: tuple[Any, float, bool, dict[str, float]] | None = None
+        if parse is not None:
+            parse_spans: dict[str, float] = {}
+            with _collect_spans(parse_spans):
+                inp, parse_runtime, cached = self.parse(parse, data)
+            parsed = (inp, parse_runtime, cached, parse_spans)
+
+        # lazy imports, only needed in parallel mode
+        import multiprocessing
+        import concurrent.futures
+
+        # fork on linux to share the input without serialization, otherwise it is pickled once per worker, as forking
+        # is unsafe on macos once libraries like numpy are loaded
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(parts),
+            mp_context=multiprocessing.get_context("fork" if sys.platform.startswith("linux") else None),
+            initializer=_init_worker,
+            initargs=(func, inp, mutable, timeout, max_memory),
+        )
+        outcomes: dict[str, concurrent.futures.Future[tuple[Any, float, dict[str, float]]]] = {
+            part: executor.submit(_run_worker, part)
+            for part in parts
+        }
+        executor.shutdown(wait=False)
+
+        return outcomes, parsed
+
+    def _solve_part(
+        self,
+        func: Callable | tuple[Callable, Callable],
+        part: Literal["a", "b"],
+        data: Data,
+        *,
+        submit: bool,
+        example: bool,
+        example_index: int,
+        mutable: bool,
+        parse: Callable[[Data], Any] | None,
+        cache: bool = False,
+        profile: Literal["cprofile", "tracemalloc", "lines"] | None = None,
+        profile_dir: str | None = None,
+        timeout: float | None = None,
+        max_memory: int | None = None,
+        outcome: concurrent.futures.Future[tuple[Any, float, dict[str, float]]] | None = None,
+        parsed: tuple[Any, float, bool, dict[str, float]] | None = None,
+    ) -> None:
         # puzzle identifier
         puzzle_id = f"{self.year}_{self.day:02d}_{part}"
         if example:
@@ -129,35 +337,66 @@ class Solver:
 
         # header
         header = f"🎄 {puzzle_id}"
-        if self.has_session:
+        if self.has_puzzle:
+            # only show the title when the puzzle was already fetched, e.g. for missing inputs, to stay offline
             header += f"  ─  {self.puzzle.title}"
         header += f"  ─  {len(data):_} data line{'' if len(data) == 1 else 's'}"
         header += " 🎄"
         width = max(len(header) + 2, 40)
         print(f"{'━' * width}\n{header}\n{'─' * width}")
 
-        # get the correct solution function to call in case there are two
-        _func: Callable
-        if isinstance(func, tuple):
-            if len(func) != 2:
-                raise ValueError("when providing a tuple of solution functions, it must have exactly two elements")
-            _func = func[0] if part == "a" else func[1]
-            pass_part = False
+        # check the result cache, unless profiling
+        cache_key = result_cache.key(func, part, data, parse=parse) if cache else None
+        hit = None if cache_key is None or profile is not None else result_cache.get(cache_key)
+        parse_spans: dict[str, float] = {}
+        spans: dict[str, float] = {}
+        profiler: Profiler | None = None
+        if hit is not None:
+            result, runtime = hit
         else:
-            _func = func
-            pass_part = True
-
-        # run the solution function
-        t1 = time.perf_counter()
-        runtime: float = 0
-        args = (copy.deepcopy(data),) + ((part,) if pass_part else ())
-        try:
-            result = _func(*args)  # type: ignore[arg-type]
-        except:
-            print(f"🚫 exception after {runtime:.2f}s")
-            raise
-        finally:
-            runtime = time.perf_counter() - t1
+            # optionally parse the input first, unless already done before dispatching to workers
+            inp: Any = data
+            if parsed is not None:
+                inp, parse_runtime, cached, parse_spans = parsed
+            elif parse is not None:
+                try:
+                    with _collect_spans(parse_spans):
+                        inp, parse_runtime, cached = self.parse(parse, data)
+                except:
+                    print("🚫 exception while parsing")
+                    raise
+
+            # setup the profiler
+            if profile is not None:
+                profile_path = None
+                if profile_dir:
+                    os.makedirs(profile_dir, exist_ok=True)
+                    profile_path = os.path.join(profile_dir, f"{puzzle_id}.{Profiler.extensions[profile]}")
+                profiler = Profiler(profile, path=profile_path)
+
+            # run the solution function, or wait for the result of a worker
+            t1 = time.perf_counter()
+            try:
+                if outcome is None:
+                    result, runtime = run_solution(
+                        func,
+                        part,
+                        inp,
+                        mutable=mutable,
+                        spans=spans,
+                        profiler=profiler,
+                        timeout=timeout,
+                        max_memory=max_memory,
+                    )
+                else:
+                    result, runtime, spans = outcome.result()
+            except:
+                print(f"🚫 exception after {human_time_diff(time.perf_counter() - t1)}")
+                raise
+
+            # store the result
+            if cache_key is not None and result is not None:
+                result_cache.set(cache_key, result, runtime)
 
         # handle the result
         if result is None:
@@ -167,7 +406,22 @@ class Solver:
         print(f"✨ solution : {fmt_num(result)}")
         if not example and (truth := getattr(self, f"truth_{part}")) is not None:
             print(f"{'✅' if result == truth else '❌'} truth    : {fmt_num(truth)}")
-        print(f"⏰ runtime  : {human_time_diff(runtime)}")
+        if hit is not None:
+            print(f"💾 runtime  : {human_time_diff(runtime)} (cached result)")
+        else:
+            if parse is not None:
+                print(f"⏰ parse    : {human_time_diff(parse_runtime)}{' (cached)' if cached else ''}")
+                _print_spans(parse_spans, parse_runtime)
+            print(f"⏰ runtime  : {human_time_diff(runtime)}")
+            _print_spans(spans, runtime)
+
+        # show the profile
+        if profiler is not None:
+            print(f"📊 profile  : {profiler.mode}")
+            for line in profiler.report():
+                print(f"   {line}")
+            if profiler.path:
+                print(f"📊 dumped   : {profiler.path}")
 
         # check if submission is an option
         if example:
@@ -199,11 +453,670 @@ class Solver:
             return
 
         # actual submission
-        val = aocd.utils.coerce(result, warn=True)
+        from aocd.utils import coerce
+        val = coerce(result, warn=True)
         if getattr(self.puzzle, f"answer_{part}", None) != val:
             self.puzzle._submit(value=val, part=part, reopen=False)
 
 
+def load_session() -> bool:
+    """
+    Sets the ``AOC_SESSION`` env var from the ``.aoc_session`` file in the repository root when missing, and returns
+    whether a session is available.
+    """
+    if not os.getenv("AOC_SESSION", "") and os.path.exists(session_file):
+        with open(session_file) as f:
+            os.environ["AOC_SESSION"] = f.read().strip()
+    return bool(os.getenv("AOC_SESSION", ""))
+
+
+def run_solution(
+    func: Callable | tuple[Callable, Callable],
+    part: Part,
+    inp: Any,
+    *,
+    mutable: bool = False,
+    spans: dict[str, float] | None = None,
+    profiler: Profiler | None = None,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> tuple[Any, float]:
+    """
+    Calls the solution *func* (or one of a 2-tuple of functions for parts a and b) for *part* with the input *inp*,
+    which is copied first when *mutable* is set. Returns the result and the runtime in seconds. Durations of
+    :py:func:`span`'s are added to *spans* when given, and the call is wrapped by the *profiler* when given.
+
+    The call is aborted after *timeout* seconds or when allocating more than *max_memory* bytes (see
+    :py:func:`limit`), in which case the elapsed time and the peak memory usage are added as a note to the raised
+    exception.
+    """
+    # get the correct solution function to call in case there are two
+    _func: Callable
+    if isinstance(func, tuple):
+        if len(func) != 2:
+            raise ValueError("when providing a tuple of solution functions, it must have exactly two elements")
+        _func = func[0] if part == "a" else func[1]
+        pass_part = False
+    else:
+        _func = func
+        pass_part = True
+
+    # copy the input if it may be modified
+    if mutable:
+        inp = list(inp) if isinstance(inp, (tuple, Lines)) else copy.deepcopy(inp)
+
+    # start time for the case that the limit is hit before the call
+    t1 = time.perf_counter()
+    try:
+        with limit(timeout=timeout, max_memory=max_memory), _collect_spans(spans), profiler or contextlib.nullcontext():
+            t1 = time.perf_counter()
+            result = _func(*((inp,) + ((part,) if pass_part else ())))
+            runtime = time.perf_counter() - t1
+    except (TimeoutError, MemoryError) as e:
+        e.add_note(f"aborted after {human_time_diff(time.perf_counter() - t1)}, peak rss {human_bytes(peak_rss())}")
+        raise
+
+    return result, runtime
+
+
+@contextlib.contextmanager
+def limit(*, timeout: float | None = None, max_memory: int | None = None) -> Iterator[None]:
+    """
+    Context manager that raises a :py:class:`TimeoutError` when the code it wraps runs longer than *timeout* seconds,
+    and makes allocations fail with a :py:class:`MemoryError` once it requested more than *max_memory* bytes of
+    additional address space. Both limits are only checked between Python bytecode instructions or on allocation,
+    so long-running calls into compiled code are not interrupted. The timeout is Unix only and requires the main
+    thread, and the memory limit is Linux only as other platforms do not enforce address space limits.
+    """
+    if timeout is None and max_memory is None:
+        yield
+        return
+    if max_memory is not None and not sys.platform.startswith("linux"):
+        raise NotImplementedError(f"max_memory is only supported on linux, not on {sys.platform}")
+
+    import resource
+
+    # set the timer
+    prev_handler: Any = None
+    if timeout is not None:
+        if timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+
+        def handler(signum: int, frame: Any) -> None:
+            raise TimeoutError(f"solution exceeded the timeout of {human_time_diff(timeout)}")
+
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    # lower the soft limit of the address space, relative to its current size
+    prev_limits = None
+    if max_memory is not None:
+        if max_memory <= 0:
+            raise ValueError(f"max_memory must be positive, got {max_memory}")
+        with open("/proc/self/statm") as f:
+            address_space = int(f.read().split()[0]) * resource.getpagesize()
+        prev_limits = resource.getrlimit(resource.RLIMIT_AS)
+        new_limit = address_space + max_memory
+        if prev_limits[1] != resource.RLIM_INFINITY:
+            new_limit = min(new_limit, prev_limits[1])
+        resource.setrlimit(resource.RLIMIT_AS, (new_limit, prev_limits[1]))
+
+    try:
+        yield
+    finally:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, prev_handler)
+        if prev_limits is not None:
+            resource.setrlimit(resource.RLIMIT_AS, prev_limits)
+
+
+def peak_rss() -> int:
+    """
+    Returns the peak resident set size of the current process in bytes.
+    """
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macos and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+# durations of spans in the solution currently running, or None when not collecting
+_spans: dict[str, float] | None = None
+
+
+@contextlib.contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Context manager that measures a named phase of a solution, e.g. ``with span("sort"): ...``. Durations of spans
+    with the same name add up and are shown below the runtime of the solution. Outside of :py:meth:`Solver.solve`,
+    nothing is measured.
+    """
+    if _spans is None:
+        yield
+        return
+
+    t1 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _spans[name] = _spans.get(name, 0.0) + time.perf_counter() - t1
+
+
+@contextlib.contextmanager
+def _collect_spans(spans: dict[str, float] | None) -> Iterator[None]:
+    global _spans
+    prev_spans, _spans = _spans, spans
+    try:
+        yield
+    finally:
+        _spans = prev_spans
+
+
+def _print_spans(spans: dict[str, float], runtime: float) -> None:
+    for i, (name, t) in enumerate(spans.items()):
+        pct = f" ({t / runtime:.0%})" if runtime else ""
+        print(f"   {'└' if i == len(spans) - 1 else '├'} {name:<6}: {human_time_diff(t)}{pct}")
+
+
+class Profiler:
+    """
+    Context manager that profiles the code it wraps in one of the following *mode*'s:
+
+        - ``"cprofile"``: deterministic profile of function calls via :py:mod:`cProfile`, reporting the *top*
+          functions by cumulative time
+        - ``"tracemalloc"``: memory profile via :py:mod:`tracemalloc`, reporting the peak allocation and the *top*
+          lines by memory still allocated at the end
+        - ``"lines"``: statistical profile that samples the executing line every *interval* seconds of cpu time,
+          reporting the *top* lines by number of samples (unix only)
+
+    When *path* is set, the full profile is dumped there on exit as pstats data, a tracemalloc snapshot or text.
+    """
+
+    modes = ("cprofile", "tracemalloc", "lines")
+
+    # file extensions of dumps per mode
+    extensions = {"cprofile": "prof", "tracemalloc": "tracemalloc", "lines": "txt"}
+
+    def __init__(
+        self,
+        mode: Literal["cprofile", "tracemalloc", "lines"],
+        *,
+        path: str | None = None,
+        top: int = 10,
+        interval: float = 0.001,
+    ) -> None:
+        super().__init__()
+
+        if mode not in self.modes:
+            raise ValueError(f"unknown profile mode '{mode}', expected one of {', '.join(self.modes)}")
+        if mode == "lines" and not hasattr(signal, "setitimer"):
+            raise ValueError("the 'lines' profile mode requires signal.setitimer which is not available")
+
+        # attributes
+        self.mode = mode
+        self.path = path
+        self.top = top
+        self.interval = interval
+
+        # profiling results
+        self._stats: Any = None
+        self._peak = 0
+        self._samples: dict[tuple[Any, int], int] = {}
+
+    def __enter__(self) -> Self:
+        if self.mode == "cprofile":
+            import cProfile
+            self._stats = cProfile.Profile()
+            self._stats.enable()
+        elif self.mode == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start()
+        else:  # lines
+            self._samples.clear()
+            self._prev_handler = signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self.mode == "cprofile":
+            self._stats.disable()
+            import pstats
+            self._stats = pstats.Stats(self._stats)
+            if self.path:
+                self._stats.dump_stats(self.path)
+        elif self.mode == "tracemalloc":
+            import tracemalloc
+            self._peak = tracemalloc.get_traced_memory()[1]
+            self._stats = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ])
+            tracemalloc.stop()
+            if self.path:
+                self._stats.dump(self.path)
+        else:  # lines
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._prev_handler)
+            if self.path:
+                with open(self.path, "w") as f:
+                    f.write("\n".join(self.report(top=None)) + "\n")
+
+    def _sample(self, signum: int, frame: Any) -> None:
+        # store the code object and instruction offset, and only resolve line numbers when reporting
+        if frame is not None:
+            key = (frame.f_code, frame.f_lasti)
+            self._samples[key] = self._samples.get(key, 0) + 1
+
+    @classmethod
+    def _lineno(cls, code: Any, offset: int) -> int | None:
+        line = next((line for start, end, line in code.co_lines() if start <= offset < end), None)
+        if line is None:
+            # backward jumps at the end of loops, where most samples are taken, have no line, so attribute them to
+            # the loop header they jump to
+            import dis
+            instr = next((instr for instr in dis.get_instructions(code) if instr.offset == offset), None)
+            if instr is not None and instr.opname.startswith("JUMP_BACKWARD") and instr.argval < offset:
+                return cls._lineno(code, instr.argval)
+        return line
+
+    @classmethod
+    def _location(cls, file_path: str, line: int | None) -> str:
+        # shorten paths within the repository
+        root = os.path.dirname(this_dir)
+        if file_path.startswith(root + os.sep):
+            file_path = os.path.relpath(file_path, root)
+        return f"{file_path}:{'?' if line is None else line}"
+
+    def report(self, top: int | None = -1) -> list[str]:
+        """
+        Returns the lines of a summary of the profile with the *top* entries, defaulting to the value passed to the
+        constructor. *None* includes all entries.
+        """
+        if top == -1:
+            top = self.top
+
+        lines = []
+        if self.mode == "cprofile":
+            lines.append(f"{'cumulative':>10}  {'own':>10}  {'calls':>9}  function")
+            # skip the profiler itself
+            entries = sorted(
+                (
+                    item for item in self._stats.stats.items()
+                    if not (item[0][0] == __file__ and item[0][2] == "__exit__") and "_lsprof" not in item[0][2]
+                ),
+                key=lambda item: item[1][3],
+                reverse=True,
+            )
+            for (file_path, line, func_name), (_, n_calls, own, cumulative, _) in entries[:top]:
+                location = func_name if file_path == "~" else f"{func_name} ({self._location(file_path, line)})"
+                lines.append(
+                    f"{human_time_diff(cumulative):>10}  {human_time_diff(own):>10}  {n_calls:>9_}  {location}",
+                )
+        elif self.mode == "tracemalloc":
+            lines.append(f"peak {human_bytes(self._peak)}, still allocated at the end:")
+            for stat in self._stats.statistics("lineno")[:top]:
+                frame = stat.traceback[0]
+                location = self._location(frame.filename, frame.lineno)
+                lines.append(f"{human_bytes(stat.size):>10}  {stat.count:>9_}  {location}")
+        else:  # lines
+            n_samples = sum(self._samples.values())
+            lines.append(f"{n_samples:_} samples every {human_time_diff(self.interval)} of cpu time")
+            line_samples: dict[tuple[str, int | None, str], int] = {}
+            for (code, offset), n in self._samples.items():
+                key = (code.co_filename, self._lineno(code, offset), code.co_qualname)
+                line_samples[key] = line_samples.get(key, 0) + n
+            entries = sorted(line_samples.items(), key=lambda item: item[1], reverse=True)
+            for (file_path, line, func_name), n in entries[:top]:
+                location = self._location(file_path, line)
+                lines.append(f"{n / n_samples:>6.1%}  {n:>7_}  {func_name} ({location})")
+
+        return lines
+
+
+class ResultCache:
+    """
+    On-disk cache of solution results, stored as one json file per entry in *path*. Keys combine a hash of the input,
+    a hash of the sources of the solution (and parse) function's module and of this package, and the part. Input
+    hashes of files are memoized by path, size and modification time, so that lookups do not read the input again.
+
+    Entries older than *max_age* seconds are evicted, as are the oldest entries beyond *max_entries*.
+    """
+
+    def __init__(self, path: str = cache_dir, *, max_age: float = 30 * 86_400, max_entries: int = 1_000) -> None:
+        super().__init__()
+
+        # attributes
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+        # in-memory memos of input and source hashes
+        self._input_hashes: dict[tuple[str, int, int], str] | None = None
+        self._source_hashes: dict[str, str] = {}
+
+    @property
+    def results_path(self) -> str:
+        return os.path.join(self.path, "results")
+
+    @property
+    def inputs_path(self) -> str:
+        return os.path.join(self.path, "inputs.json")
+
+    def _source_hash(self, file_path: str) -> str:
+        if file_path not in self._source_hashes:
+            with open(file_path, "rb") as f:
+                self._source_hashes[file_path] = hashlib.sha256(f.read()).hexdigest()
+        return self._source_hashes[file_path]
+
+    def input_hash(self, data: Data) -> str:
+        """
+        Returns a hash of the input lines *data*. For lines of a complete file, the hash of the file content is
+        memoized on disk.
+        """
+        if not isinstance(data, Lines) or data.sliced:
+            h = hashlib.sha256()
+            for line in data:
+                h.update(line.encode())
+                h.update(b"\n")
+            return h.hexdigest()
+
+        # check the memo first
+        stat = os.stat(data.path)
+        memo_key = (os.path.abspath(data.path), stat.st_size, stat.st_mtime_ns)
+        if self._input_hashes is None:
+            self._input_hashes = {}
+            if os.path.exists(self.inputs_path):
+                with open(self.inputs_path, "r") as f:
+                    self._input_hashes = {(p, size, mtime): h for p, size, mtime, h in json.load(f)}
+        if memo_key not in self._input_hashes:
+            with open(data.path, "rb") as f:
+                self._input_hashes[memo_key] = hashlib.file_digest(f, "sha256").hexdigest()
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f"{self.inputs_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump([[*key, h] for key, h in self._input_hashes.items()], f)
+            os.replace(tmp_path, self.inputs_path)
+
+        return f"{self._input_hashes[memo_key]}-{int(data.strip)}{int(data.strip_empty)}"
+
+    def key(
+        self,
+        func: Callable | tuple[Callable, Callable],
+        part: Literal["a", "b"],
+        data: Data,
+        *,
+        parse: Callable[[Data], Any] | None = None,
+    ) -> str:
+        """
+        Returns the cache key for solving *part* with *func* (and *parse*) on *data*.
+        """
+        funcs = list(func) if isinstance(func, tuple) else [func]
+        if parse is not None:
+            funcs.append(parse)
+        h = hashlib.sha256()
+        h.update(self.input_hash(data).encode())
+        h.update(self._source_hash(__file__).encode())
+        for _func in funcs:
+            h.update(f"{_func.__module__}.{_func.__qualname__}".encode())
+            h.update(self._source_hash(_func.__code__.co_filename).encode())
+        h.update(part.encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """
+        Returns the result and original runtime stored for *key*, or *None* if missing or expired.
+        """
+        entry_path = os.path.join(self.results_path, f"{key}.json")
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry["created"] > self.max_age:
+            return None
+        return entry["result"], entry["runtime"]
+
+    def set(self, key: str, result: Any, runtime: float) -> None:
+        """
+        Stores *result* and its *runtime* for *key* and evicts old entries.
+        """
+        os.makedirs(self.results_path, exist_ok=True)
+        entry_path = os.path.join(self.results_path, f"{key}.json")
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"result": result, "runtime": runtime, "created": time.time()}, f)
+        os.replace(tmp_path, entry_path)
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Removes expired entries and the oldest entries beyond :py:attr:`max_entries`, and returns their number.
+        """
+        if not os.path.isdir(self.results_path):
+            return 0
+        entries = sorted(
+            (entry.stat().st_mtime, entry.path)
+            for entry in os.scandir(self.results_path)
+            if entry.name.endswith(".json")
+        )
+        now = time.time()
+        remove = [
+            path
+            for i, (mtime, path) in enumerate(entries)
+            if now - mtime > self.max_age or len(entries) - i > self.max_entries
+        ]
+        for path in remove:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return len(remove)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and memoized input hashes.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._input_hashes = None
+
+
+# default result cache
+result_cache = ResultCache()
+
+
+# solution function, input, mutable flag, timeout and memory limit in worker processes, set once per worker by
+# _init_worker
+_worker_state: tuple[Callable | tuple[Callable, Callable], Any, bool, float | None, int | None] | None = None
+
+
+def _init_worker(
+    func: Callable | tuple[Callable, Callable],
+    inp: Any,
+    mutable: bool,
+    timeout: float | None,
+    max_memory: int | None,
+) -> None:
+    global _worker_state
+    _worker_state = (func, inp, mutable, timeout, max_memory)
+
+
+def _run_worker(part: Part) -> tuple[Any, float, dict[str, float]]:
+    assert _worker_state is not None
+    func, inp, mutable, timeout, max_memory = _worker_state
+    spans: dict[str, float] = {}
+    result, runtime = run_solution(
+        func,
+        part,
+        inp,
+        mutable=mutable,
+        spans=spans,
+        timeout=timeout,
+        max_memory=max_memory,
+    )
+    return result, runtime, spans
+
+
+class Lines(Sequence[str]):
+    """
+    Read-only sequence of lines in a memory-mapped file. The positions of all lines are indexed once upon creation,
+    whereas the lines themselves are only decoded (and optionally stripped) when accessed. Slicing returns a view
+    on the same buffer.
+
+    Lines are split at ``\n`` and ``\r\n`` only, unlike :py:meth:`str.splitlines`, so that a lone ``\r`` or other
+    unicode line boundaries remain part of a line.
+    """
+
+    # ascii whitespace bytes that can make a line empty after stripping, while lines starting with non-ascii bytes
+    # are checked as well as they might begin with unicode whitespace
+    whitespace = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+    # files up to this size are indexed in python, avoiding the import of numpy for small inputs
+    small_size = 2**20
+
+    # number of bytes scanned at once for newlines
+    scan_size = 2**22
+
+    # number of lines whose positions are converted to python integers at once during iteration
+    chunk_size = 2**16
+
+    def __init__(self, path: str, *, strip: bool = True, strip_empty: bool = True) -> None:
+        super().__init__()
+
+        # attributes
+        self.path = path
+        self.strip = strip
+        self.strip_empty = strip_empty
+        self.sliced = False
+
+        # map the file and build the line index
+        self._buf = self._map(path)
+        self._starts, self._ends = self._index(self._buf, strip=strip, strip_empty=strip_empty)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the buffer is re-mapped when unpickling, so only the index is serialized
+        state = self.__dict__.copy()
+        state.pop("_buf")
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._buf = self._map(self.path)
+
+    @classmethod
+    def _map(cls, path: str) -> mmap.mmap | bytes:
+        with open(path, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def _index(cls, buf: mmap.mmap | bytes, *, strip: bool, strip_empty: bool) -> tuple[Any, Any]:
+        if len(buf) <= cls.small_size:
+            return cls._index_small(buf, strip=strip, strip_empty=strip_empty)
+
+        import numpy as np
+
+        arr = np.frombuffer(buf, dtype=np.uint8)
+        dtype: Any = np.int32 if len(arr) < 2**31 else np.int64
+
+        # line boundaries, following str.splitlines by not counting a trailing newline as a new line, scanned in
+        # chunks twice (counting, then filling) to avoid temporary copies of the index
+        chunks = [slice(offset, offset + cls.scan_size) for offset in range(0, len(arr), cls.scan_size)]
+        n_newlines = sum(int(np.count_nonzero(arr[chunk] == ord("\n"))) for chunk in chunks)
+        n_lines = n_newlines + int(not len(arr) or arr[-1] != ord("\n"))
+        starts = np.zeros(n_lines, dtype=dtype)
+        ends = np.full(n_lines, len(arr), dtype=dtype)
+        i = 0
+        for chunk in chunks:
+            newlines = np.flatnonzero(arr[chunk] == ord("\n")) + chunk.start
+            ends[i:i + len(newlines)] = newlines
+            starts[i + 1:i + 1 + len(newlines)] = newlines[:n_lines - i - 1] + 1
+            i += len(newlines)
+        if not len(arr):
+            starts, ends = starts[:0], ends[:0]
+
+        # exclude carriage returns
+        if buf.find(b"\r") != -1:
+            ends -= (ends > starts) & (arr[np.maximum(ends - 1, 0)] == ord("\r"))
+
+        # drop lines that are empty after stripping, only checking those in python that start with whitespace
+        if strip and strip_empty and len(starts):
+            is_whitespace = np.zeros(256, dtype=bool)
+            is_whitespace[list(cls.whitespace)] = True
+            is_whitespace[0x80:] = True
+            empty = ends == starts
+            candidates = np.flatnonzero(is_whitespace[arr[starts]] & ~empty)
+            for j in candidates.tolist():
+                empty[j] = not buf[starts[j]:ends[j]].decode().strip()
+            if empty.any():
+                starts, ends = starts[~empty], ends[~empty]
+
+        return starts, ends
+
+    @classmethod
+    def _index_small(
+        cls,
+        buf: mmap.mmap | bytes,
+        *,
+        strip: bool,
+        strip_empty: bool,
+    ) -> tuple[array.array, array.array]:
+        # same as above, but line by line in python
+        starts, ends = array.array("q"), array.array("q")
+        lines = bytes(buf).split(b"\n")
+        if not lines[-1]:
+            lines.pop()
+        start = 0
+        for line in lines:
+            drop = strip and strip_empty and (
+                not line or
+                (line[0] in cls.whitespace or line[0] >= 0x80) and not line.decode().strip()
+            )
+            if not drop:
+                starts.append(start)
+                ends.append(start + len(line) - int(line[-1:] == b"\r"))
+            start += len(line) + 1
+        return starts, ends
+
+    def _view(self, starts: Any, ends: Any) -> Lines:
+        inst = object.__new__(self.__class__)
+        inst.__dict__.update(self.__dict__)
+        inst._starts, inst._ends = starts, ends
+        inst.sliced = True
+        return inst
+
+    def _decode(self, start: int, end: int) -> str:
+        line = self._buf[start:end].decode()
+        return line.strip() if self.strip else line
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r}, {len(self):_} lines)"
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Lines:
+        ...
+
+    def __getitem__(self, index: int | slice) -> str | Lines:
+        if isinstance(index, slice):
+            return self._view(self._starts[index], self._ends[index])
+        return self._decode(int(self._starts[index]), int(self._ends[index]))
+
+    def __iter__(self) -> Iterator[str]:
+        for offset in range(0, len(self), self.chunk_size):
+            chunk = slice(offset, offset + self.chunk_size)
+            for start, end in zip(self._starts[chunk].tolist(), self._ends[chunk].tolist()):
+                yield self._decode(start, end)
+
+
 def human_time_diff(seconds: float) -> str:
     """
     Convert a time in seconds to a human-readable string.
@@ -217,7 +1130,32 @@ def human_time_diff(seconds: float) -> str:
     return f"{seconds:.2f} s"
 
 
+def human_bytes(n: int) -> str:
+    """
+    Convert a number of bytes to a human-readable string.
+    """
+    if abs(n) < 1024:
+        return f"{n} B"
+    size = n / 1024
+    for unit in ["kB", "MB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+# shortcut to create point instances without calling __init__
+_object_new = object.__new__
+
+
 class Point:  # noqa
+    """
+    Mutable two-dimensional integer point with element-wise arithmetic. Operands can be points or values that are
+    interpretable as points, with a fast path for the former. Points are hashed by value and must therefore not be
+    modified while used as keys in dicts or sets.
+    """
+
+    __slots__ = ("i", "j")
 
     InterpretableTypes: TypeAlias = (
         int |
@@ -260,14 +1198,20 @@ class Point:  # noqa
             return i, j
         return TypeError(f"invalid value for {cls.__name__}: {other}")
 
+    @classmethod
+    def _new(cls, i: int, j: int) -> Self:
+        # create an instance from values known to be valid, skipping the validation in __init__
+        point = object.__new__(cls)
+        point.i = i
+        point.j = j
+        return point
+
     def __init__(
         self,
         i: Point | InterpretableTypes | None = None,
         j: int | None = None,
         /,
     ) -> None:
-        super().__init__()
-
         # rearrange values under certain conditions
         if j is None:
             if i is None:
@@ -301,70 +1245,100 @@ class Point:  # noqa
         return self.i != 0 and self.j != 0
 
     def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Point):
+            return self.i == other.i and self.j == other.j
         tpl = self._cast_tuple(other)
         return False if tpl is None else tpl == (self.i, self.j)
 
     def __neg__(self) -> Self:
-        return self.__class__(-self.i, -self.j)
+        return self._new(-self.i, -self.j)
 
     def __add__(self, other: Point | InterpretableTypes) -> Self:
+        if isinstance(other, Point):
+            # inlined instance creation, avoiding the overhead of calling _new
+            point = _object_new(self.__class__)
+            point.i = self.i + other.i
+            point.j = self.j + other.j
+            return point
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i + tpl[0], self.j + tpl[1])
+        return self._new(self.i + tpl[0], self.j + tpl[1])
 
     def __radd__(self, other: Point | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] + self.i, tpl[1] + self.j)
+        return self._new(tpl[0] + self.i, tpl[1] + self.j)
 
     def __iadd__(self, other: Point | InterpretableTypes) -> Self:
-        tpl = self._cast_tuple(other)
-        if isinstance(tpl, Exception):
-            raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
-        self.i += tpl[0]
-        self.j += tpl[1]
+        if isinstance(other, Point):
+            self.i += other.i
+            self.j += other.j
+        else:
+            tpl = self._cast_tuple(other)
+            if isinstance(tpl, Exception):
+                raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
+            self.i += tpl[0]
+            self.j += tpl[1]
         return self
 
     def __sub__(self, other: Point | InterpretableTypes) -> Self:
+        if isinstance(other, Point):
+            point = _object_new(self.__class__)
+            point.i = self.i - other.i
+            point.j = self.j - other.j
+            return point
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i - tpl[0], self.j - tpl[1])
+        return self._new(self.i - tpl[0], self.j - tpl[1])
 
     def __rsub__(self, other: Point | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] - self.i, tpl[1] - self.j)
+        return self._new(tpl[0] - self.i, tpl[1] - self.j)
 
     def __isub__(self, other: Point | InterpretableTypes) -> Self:
-        tpl = self._cast_tuple(other)
-        if isinstance(tpl, Exception):
-            raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
-        self.i -= tpl[0]
-        self.j -= tpl[1]
+        if isinstance(other, Point):
+            self.i -= other.i
+            self.j -= other.j
+        else:
+            tpl = self._cast_tuple(other)
+            if isinstance(tpl, Exception):
+                raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
+            self.i -= tpl[0]
+            self.j -= tpl[1]
         return self
 
     def __mul__(self, other: Point | InterpretableTypes) -> Self:
+        if isinstance(other, Point):
+            point = _object_new(self.__class__)
+            point.i = self.i * other.i
+            point.j = self.j * other.j
+            return point
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i * tpl[0], self.j * tpl[1])
+        return self._new(self.i * tpl[0], self.j * tpl[1])
 
     def __rmul__(self, other: Point | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] * self.i, tpl[1] * self.j)
+        return self._new(tpl[0] * self.i, tpl[1] * self.j)
 
     def __imul__(self, other: Point | InterpretableTypes) -> Self:
-        tpl = self._cast_tuple(other)
-        if isinstance(tpl, Exception):
-            raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
-        self.i *= tpl[0]
-        self.j *= tpl[1]
+        if isinstance(other, Point):
+            self.i *= other.i
+            self.j *= other.j
+        else:
+            tpl = self._cast_tuple(other)
+            if isinstance(tpl, Exception):
+                raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
+            self.i *= tpl[0]
+            self.j *= tpl[1]
         return self
 
     @property
@@ -384,18 +1358,23 @@ class Point:  # noqa
 
 # derived types
 class Dim(Point):
-    pass
+    __slots__ = ()
 
 
 class Direction(Point):
-    pass
+    __slots__ = ()
 
 
 class Area(Point):
-    pass
+    __slots__ = ()
 
 
 class Point3:
+    """
+    Mutable three-dimensional integer point with element-wise arithmetic, analogous to :py:class:`Point`.
+    """
+
+    __slots__ = ("i", "j", "k")
 
     InterpretableTypes: TypeAlias = (
         list[int | float] |
@@ -429,6 +1408,15 @@ class Point3:
             return i, j, k
         return TypeError(f"invalid value for {cls.__name__}: {other}")
 
+    @classmethod
+    def _new(cls, i: int, j: int, k: int) -> Self:
+        # create an instance from values known to be valid, skipping the validation in __init__
+        point = object.__new__(cls)
+        point.i = i
+        point.j = j
+        point.k = k
+        return point
+
     def __init__(
         self,
         i: Point3 | InterpretableTypes | int | None = None,
@@ -436,8 +1424,6 @@ class Point3:
         k: int | None = None,
         /,
     ) -> None:
-        super().__init__()
-
         # rearrange values under certain conditions
         if j is None and k is None:
             if i is None:
@@ -474,73 +1460,108 @@ class Point3:
         return self.i != 0 and self.j != 0 and self.k != 0
 
     def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Point3):
+            return self.i == other.i and self.j == other.j and self.k == other.k
         tpl = self._cast_tuple(other)
         return False if tpl is None else tpl == (self.i, self.j, self.k)
 
     def __neg__(self) -> Self:
-        return self.__class__(-self.i, -self.j, -self.k)
+        return self._new(-self.i, -self.j, -self.k)
 
     def __add__(self, other: Point3 | InterpretableTypes) -> Self:
+        if isinstance(other, Point3):
+            point = _object_new(self.__class__)
+            point.i = self.i + other.i
+            point.j = self.j + other.j
+            point.k = self.k + other.k
+            return point
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i + tpl[0], self.j + tpl[1], self.k + tpl[2])
+        return self._new(self.i + tpl[0], self.j + tpl[1], self.k + tpl[2])
 
     def __radd__(self, other: Point3 | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for +: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] + self.i, tpl[1] + self.j, tpl[2] + self.k)
+        return self._new(tpl[0] + self.i, tpl[1] + self.j, tpl[2] + self.k)
 
     def __iadd__(self, other: Point3 | InterpretableTypes) -> Self:
-        tpl = self._cast_tuple(other)
-        if isinstance(tpl, Exception):
-            raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
-        self.i += tpl[0]
-        self.j += tpl[1]
-        self.k += tpl[2]
+        if isinstance(other, Point3):
+            self.i += other.i
+            self.j += other.j
+            self.k += other.k
+        else:
+            tpl = self._cast_tuple(other)
+            if isinstance(tpl, Exception):
+                raise TypeError(f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'")
+            self.i += tpl[0]
+            self.j += tpl[1]
+            self.k += tpl[2]
         return self
 
     def __sub__(self, other: Point3 | InterpretableTypes) -> Self:
+        if isinstance(other, Point3):
+            point = _object_new(self.__class__)
+            point.i = self.i - other.i
+            point.j = self.j - other.j
+            point.k = self.k - other.k
+            return point
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i - tpl[0], self.j - tpl[1], self.k - tpl[2])
+        return self._new(self.i - tpl[0], self.j - tpl[1], self.k - tpl[2])
 
     def __rsub__(self, other: Point3 | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for -: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] - self.i, tpl[1] - self.j, tpl[2] - self.k)
+        return self._new(tpl[0] - self.i, tpl[1] - self.j, tpl[2] - self.k)
 
     def __isub__(self, other: Point3 | InterpretableTypes) -> Self:
-        tpl = self._cast_tuple(other)
-        if isinstance(tpl, Exception):
-            raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
-        self.i -= tpl[0]
-        self.j -= tpl[1]
-        self.k -= tpl[2]
+        if isinstance(other, Point3):
+            self.i -= other.i
+            self.j -= other.j
+            self.k -= other.k
+        else:
+            tpl = self._cast_tuple(other)
+            if isinstance(tpl, Exception):
+                raise TypeError(f"unsupported operand type(s) for -: '{type(self)}' and '{type(other)}'")
+            self.i -= tpl[0]
+            self.j -= tpl[1]
+            self.k -= tpl[2]
         return self
 
     def __mul__(self, other: Point3 | InterpretableTypes) -> Self:
+        if isinstance(other, Point3):
+            point = _object_new(self.__class__)
+            point.i = self.i * other.i
+            point.j = self.j * other.j
+            point.k = self.k * other.k
+            return point
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
-        return self.__class__(self.i * tpl[0], self.j * tpl[1], self.k * tpl[2])
+        return self._new(self.i * tpl[0], self.j * tpl[1], self.k * tpl[2])
 
     def __rmul__(self, other: Point3 | InterpretableTypes) -> Self:
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for *: '{type(other)}' and '{type(self)}'")
-        return self.__class__(tpl[0] * self.i, tpl[1] * self.j, tpl[2] * self.k)
+        return self._new(tpl[0] * self.i, tpl[1] * self.j, tpl[2] * self.k)
 
     def __imul__(self, other: Point3 | InterpretableTypes) -> Self:
-        tpl = self._cast_tuple(other)
-        if isinstance(tpl, Exception):
-            raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
-        self.i *= tpl[0]
-        self.j *= tpl[1]
-        self.k *= tpl[2]
+        if isinstance(other, Point3):
+            self.i *= other.i
+            self.j *= other.j
+            self.k *= other.k
+        else:
+            tpl = self._cast_tuple(other)
+            if isinstance(tpl, Exception):
+                raise TypeError(f"unsupported operand type(s) for *: '{type(self)}' and '{type(other)}'")
+            self.i *= tpl[0]
+            self.j *= tpl[1]
+            self.k *= tpl[2]
         return self
 
     @property
@@ -554,7 +1575,784 @@ class Point3:
         return self * factor
 
     def distance(self, other: Point3 | InterpretableTypes) -> float:
+        if isinstance(other, Point3):
+            return ((self.i - other.i)**2 + (self.j - other.j)**2 + (self.k - other.k)**2)**0.5
         tpl = self._cast_tuple(other)
         if isinstance(tpl, Exception):
             raise TypeError(f"unsupported operand type(s) for distance: '{type(self)}' and '{type(other)}'")
         return ((self.i - tpl[0])**2 + (self.j - tpl[1])**2 + (self.k - tpl[2])**2)**0.5
+
+
+class PointView(Point):
+    """
+    :py:class:`Point` that reads and writes its values from and to row *index* of an (n, 2) numpy *array* without
+    copying, as returned by :py:class:`PointArray`. Arithmetic results are regular points.
+    """
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: np.ndarray, index: int, /) -> None:
+        self._array = array
+        self._index = index
+
+    @classmethod
+    def _new(cls, i: int, j: int) -> Point:  # type: ignore[override]
+        return Point._new(i, j)
+
+    @property  # type: ignore[override]
+    def i(self) -> int:
+        return int(self._array[self._index, 0])
+
+    @i.setter
+    def i(self, i: int) -> None:
+        self._array[self._index, 0] = i
+
+    @property  # type: ignore[override]
+    def j(self) -> int:
+        return int(self._array[self._index, 1])
+
+    @j.setter
+    def j(self, j: int) -> None:
+        self._array[self._index, 1] = j
+
+    def __neg__(self) -> Point:  # type: ignore[override]
+        return -Point._new(self.i, self.j)
+
+    def __add__(self, other: Point | Point.InterpretableTypes) -> Point:  # type: ignore[override]
+        return Point._new(self.i, self.j) + other
+
+    def __sub__(self, other: Point | Point.InterpretableTypes) -> Point:  # type: ignore[override]
+        return Point._new(self.i, self.j) - other
+
+    def __mul__(self, other: Point | Point.InterpretableTypes) -> Point:  # type: ignore[override]
+        return Point._new(self.i, self.j) * other
+
+
+class Point3View(Point3):
+    """
+    :py:class:`Point3` that reads and writes its values from and to row *index* of an (n, 3) numpy *array* without
+    copying, as returned by :py:class:`Point3Array`. Arithmetic results are regular points.
+    """
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: np.ndarray, index: int, /) -> None:
+        self._array = array
+        self._index = index
+
+    @classmethod
+    def _new(cls, i: int, j: int, k: int) -> Point3:  # type: ignore[override]
+        return Point3._new(i, j, k)
+
+    @property  # type: ignore[override]
+    def i(self) -> int:
+        return int(self._array[self._index, 0])
+
+    @i.setter
+    def i(self, i: int) -> None:
+        self._array[self._index, 0] = i
+
+    @property  # type: ignore[override]
+    def j(self) -> int:
+        return int(self._array[self._index, 1])
+
+    @j.setter
+    def j(self, j: int) -> None:
+        self._array[self._index, 1] = j
+
+    @property  # type: ignore[override]
+    def k(self) -> int:
+        return int(self._array[self._index, 2])
+
+    @k.setter
+    def k(self, k: int) -> None:
+        self._array[self._index, 2] = k
+
+    def __neg__(self) -> Point3:  # type: ignore[override]
+        return -Point3._new(self.i, self.j, self.k)
+
+    def __add__(self, other: Point3 | Point3.InterpretableTypes) -> Point3:  # type: ignore[override]
+        return Point3._new(self.i, self.j, self.k) + other
+
+    def __sub__(self, other: Point3 | Point3.InterpretableTypes) -> Point3:  # type: ignore[override]
+        return Point3._new(self.i, self.j, self.k) - other
+
+    def __mul__(self, other: Point3 | Point3.InterpretableTypes) -> Point3:  # type: ignore[override]
+        return Point3._new(self.i, self.j, self.k) * other
+
+
+class _PointArray:
+    """
+    Base class of arrays of integer points in contiguous memory, backed by a numpy *array* of shape (n, n_dims),
+    with vectorized arithmetic and geometry. *points* can be a numpy array, which is not copied, or an iterable of
+    values interpretable as points. Elements are returned as views on the array, and slices as arrays sharing its
+    memory.
+
+    Operands of arithmetic can be single points, point arrays of the same length or numpy arrays broadcastable to
+    the shape of the array.
+    """
+
+    __slots__ = ("array",)
+
+    # point types of elements and views, and number of dimensions, set by subclasses
+    point_cls: type[Point] | type[Point3]
+    view_cls: type[PointView] | type[Point3View]
+    n_dims: int
+
+    def __init__(self, points: _PointArray | np.ndarray | Iterable[Any] = (), /) -> None:
+        import numpy as np
+
+        if isinstance(points, _PointArray):
+            points = points.array
+        if isinstance(points, np.ndarray):
+            if not np.issubdtype(points.dtype, np.integer):
+                raise TypeError(f"invalid dtype for {self.__class__.__name__}: {points.dtype}")
+            array = points.astype(np.int64, copy=False)
+        else:
+            tpls = [self._cast_point(point) for point in points]
+            array = np.array(tpls, dtype=np.int64).reshape(len(tpls), self.n_dims)
+        if array.ndim != 2 or array.shape[1] != self.n_dims:
+            raise ValueError(f"invalid shape for {self.__class__.__name__}: {array.shape}")
+
+        self.array: np.ndarray = array
+
+    @classmethod
+    def _cast_point(cls, point: Any) -> tuple[int, ...]:
+        tpl = cls.point_cls._cast_tuple(point)
+        if isinstance(tpl, Exception):
+            raise tpl
+        return tpl
+
+    @classmethod
+    def _cast_operand(cls, other: Any) -> np.ndarray:
+        import numpy as np
+
+        if isinstance(other, _PointArray):
+            if other.n_dims != cls.n_dims:
+                raise TypeError(f"unsupported operand for {cls.__name__}: {other.__class__.__name__}")
+            return other.array
+        if isinstance(other, np.ndarray):
+            return other
+        return np.array(cls._cast_point(other), dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.array.tolist()})"
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    @overload
+    def __getitem__(self, key: int | np.integer) -> PointView | Point3View:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice | np.ndarray) -> Self:
+        ...
+
+    def __getitem__(self, key: int | np.integer | slice | np.ndarray) -> PointView | Point3View | Self:
+        # any integer scalar, including numpy integers, selects a single point
+        try:
+            index = operator.index(key)  # type: ignore[arg-type]
+        except TypeError:
+            return self.__class__(self.array[key])
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"{self.__class__.__name__} index out of range: {index}")
+        return self.view_cls(self.array, index % len(self))
+
+    def __iter__(self) -> Iterator[PointView | Point3View]:
+        for index in range(len(self)):
+            yield self.view_cls(self.array, index)
+
+    def __neg__(self) -> Self:
+        return self.__class__(-self.array)
+
+    def __add__(self, other: Any) -> Self:
+        return self.__class__(self.array + self._cast_operand(other))
+
+    def __radd__(self, other: Any) -> Self:
+        return self.__class__(self._cast_operand(other) + self.array)
+
+    def __iadd__(self, other: Any) -> Self:
+        self.array += self._cast_operand(other)
+        return self
+
+    def __sub__(self, other: Any) -> Self:
+        return self.__class__(self.array - self._cast_operand(other))
+
+    def __rsub__(self, other: Any) -> Self:
+        return self.__class__(self._cast_operand(other) - self.array)
+
+    def __isub__(self, other: Any) -> Self:
+        self.array -= self._cast_operand(other)
+        return self
+
+    def __mul__(self, other: Any) -> Self:
+        return self.__class__(self.array * self._cast_operand(other))
+
+    def __rmul__(self, other: Any) -> Self:
+        return self.__class__(self._cast_operand(other) * self.array)
+
+    def __imul__(self, other: Any) -> Self:
+        self.array *= self._cast_operand(other)
+        return self
+
+    @property
+    def i(self) -> np.ndarray:
+        return self.array[:, 0]
+
+    @property
+    def j(self) -> np.ndarray:
+        return self.array[:, 1]
+
+    def scale(self, factor: Any, inplace: bool = False) -> Self:
+        if inplace:
+            self *= factor
+            return self
+        return self * factor
+
+    def bounds(self) -> tuple[Point | Point3, Point | Point3]:
+        """
+        Returns the minimum and maximum corners of the bounding box of all points.
+        """
+        if not len(self):
+            raise ValueError(f"bounds of empty {self.__class__.__name__} are undefined")
+        return (
+            self.point_cls._new(*map(int, self.array.min(axis=0))),  # type: ignore[arg-type]
+            self.point_cls._new(*map(int, self.array.max(axis=0))),  # type: ignore[arg-type]
+        )
+
+    def distance(self, other: Any, *, squared: bool = False) -> np.ndarray:
+        """
+        Returns the euclidean distances between all points and *other*, which can be a single point or an array of
+        the same length, or their squares when *squared* is set.
+        """
+        import numpy as np
+
+        dist2 = ((self.array - self._cast_operand(other))**2).sum(axis=1)
+        return dist2 if squared else np.sqrt(dist2)
+
+    def pairwise_distances(self, other: _PointArray | None = None, *, squared: bool = False) -> np.ndarray:
+        """
+        Returns the (n, m) matrix of euclidean distances between all points and all *m* points of *other*, defaulting
+        to this array, or their squares when *squared* is set.
+        """
+        import numpy as np
+
+        b = self.array if other is None else self._cast_operand(other)
+        dist2 = np.zeros((len(self.array), len(b)), dtype=np.int64)
+        for d in range(self.n_dims):
+            dist2 += (self.array[:, d, None] - b[None, :, d])**2
+        return dist2 if squared else np.sqrt(dist2)
+
+    def closest_pairs(self, *, k: int = 8) -> Iterator[tuple[int, int, int]]:
+        """
+        Lazily yields all pairs of indices *i* < *j* together with their squared distance, in increasing order of the
+        distance and then the indices. The *k* nearest neighbors of all points are queried from a k-d tree and merged
+        in a heap. The neighbors of a single point are queried again, twice as many each time, only when the heap
+        reaches the farthest one so far, so that taking the first *m* pairs is far cheaper than sorting all of them.
+        """
+        import heapq
+        import numpy as np
+        from scipy.spatial import cKDTree  # type: ignore[import-untyped]
+
+        n = len(self.array)
+        if n < 2:
+            return
+        tree = cKDTree(self.array)
+
+        def query(idxs: np.ndarray, k: int, min_dist2: int = 0) -> list[tuple[int, int, int]]:
+            # query neighbors including the points themselves and sort them by exact distance and index
+            n_query = min(k + 1, n)
+            nbrs = tree.query(self.array[idxs], k=n_query)[1].reshape(len(idxs), n_query)
+            dist2 = ((self.array[nbrs] - self.array[idxs, None])**2).sum(axis=-1)
+            order = np.lexsort((nbrs, dist2))
+            nbrs = np.take_along_axis(nbrs, order, axis=-1)
+            dist2 = np.take_along_axis(dist2, order, axis=-1)
+            # keep pairs that were not queried before, and, unless all points were queried, only those closer than
+            # the farthest neighbor since the tree does not order equal distances by index, in which case a negative
+            # marker entry triggers the next query once the heap reaches that distance
+            mask = (nbrs > idxs[:, None]) & (dist2 >= min_dist2)
+            entries = []
+            if n_query < n:
+                mask &= dist2 < dist2[:, -1:]
+                entries = list(zip(dist2[:, -1].tolist(), idxs.tolist(), [-k] * len(idxs)))
+            i = np.broadcast_to(idxs[:, None], mask.shape)[mask]
+            return entries + list(zip(dist2[mask].tolist(), i.tolist(), nbrs[mask].tolist()))
+
+        heap = query(np.arange(n), k)
+        heapq.heapify(heap)
+        while heap:
+            dist2, i, j = heapq.heappop(heap)
+            if j >= 0:
+                yield i, j, dist2
+                continue
+            for entry in query(np.array([i]), -2 * j, dist2):
+                heapq.heappush(heap, entry)
+
+    def spanning_tree(self) -> list[tuple[int, int, int]]:
+        """
+        Returns the edges of a euclidean minimum spanning tree as tuples of indices *i* < *j* and their squared
+        distance, sorted by distance and then indices, i.e., in the order in which Kruskal's algorithm adds them. The
+        tree is computed over the edges of the Delaunay triangulation, which contains it, so that equal distances can
+        resolve to another, equally short tree. Degenerate points that cannot be fully triangulated (e.g. coplanar or
+        duplicate ones) fall back to Kruskal's algorithm over :py:meth:`closest_pairs`.
+        """
+        import numpy as np
+        from scipy.sparse import coo_array  # type: ignore[import-untyped]
+        from scipy.sparse.csgraph import minimum_spanning_tree  # type: ignore[import-untyped]
+        from scipy.spatial import Delaunay, QhullError  # type: ignore[import-untyped]
+        from scipy.cluster.hierarchy import DisjointSet  # type: ignore[import-untyped]
+
+        n = len(self.array)
+        try:
+            simplices = Delaunay(self.array).simplices.astype(np.int64)
+        except (QhullError, ValueError):
+            simplices = None
+
+        if simplices is not None:
+            # unique edges of all simplices, encoded as i * n + j and deduplicated after sorting
+            col1, col2 = np.triu_indices(simplices.shape[1], k=1)
+            idx1, idx2 = simplices[:, col1].ravel(), simplices[:, col2].ravel()
+            keys = np.sort(np.minimum(idx1, idx2) * n + np.maximum(idx1, idx2))
+            i, j = np.divmod(keys[np.diff(keys, prepend=-1) != 0], n)
+            # tree over all edges, shifting squared distances by one to keep duplicate points connected, which
+            # preserves the tree as all spanning trees have the same number of edges
+            dist2 = ((self.array[i] - self.array[j])**2).sum(axis=-1)
+            tree = minimum_spanning_tree(coo_array(((dist2 + 1).astype(float), (i, j)), shape=(n, n))).tocoo()
+            i, j = np.minimum(tree.row, tree.col), np.maximum(tree.row, tree.col)
+            # points dropped by the triangulation leave the tree incomplete
+            if len(i) == n - 1:
+                dist2 = ((self.array[i] - self.array[j])**2).sum(axis=-1)
+                order = np.lexsort((j, i, dist2))
+                return list(zip(i[order].tolist(), j[order].tolist(), dist2[order].tolist()))
+
+        # kruskal's algorithm, stopping once all points are connected
+        clusters = DisjointSet(range(n))
+        edges: list[tuple[int, int, int]] = []
+        for i, j, dist2 in self.closest_pairs():
+            if len(edges) == n - 1:
+                break
+            if clusters.merge(i, j):
+                edges.append((i, j, dist2))
+        return edges
+
+
+class PointArray(_PointArray):
+    """
+    Array of two-dimensional integer points with :py:class:`PointView` elements (see :py:class:`_PointArray`).
+    """
+
+    __slots__ = ()
+
+    point_cls = Point
+    view_cls = PointView
+    n_dims = 2
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.array[:, 0] * self.array[:, 1]
+
+
+class Point3Array(_PointArray):
+    """
+    Array of three-dimensional integer points with :py:class:`Point3View` elements (see :py:class:`_PointArray`).
+    """
+
+    __slots__ = ()
+
+    point_cls = Point3
+    view_cls = Point3View
+    n_dims = 3
+
+    @property
+    def k(self) -> np.ndarray:
+        return self.array[:, 2]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.array[:, 0] * self.array[:, 1] * self.array[:, 2]
+
+
+class Grid:
+    """
+    Dense two-dimensional grid of single-byte characters, stored as a numpy uint8 *array* of shape (rows, columns).
+    Positions are :py:class:`Point`'s (or values interpretable as points) with *i* being the row and *j* the column,
+    and steps between them are :py:class:`Direction`'s, e.g. ``grid[pos + Grid.directions4[0]]``. Unlike numpy
+    indexing, negative positions are outside the grid.
+    """
+
+    # unit steps to the 4 and 8 neighbors, starting upwards and going clockwise
+    directions4 = (Direction(-1, 0), Direction(0, 1), Direction(1, 0), Direction(0, -1))
+    directions8 = (
+        Direction(-1, 0), Direction(-1, 1), Direction(0, 1), Direction(1, 1),
+        Direction(1, 0), Direction(1, -1), Direction(0, -1), Direction(-1, -1),
+    )
+
+    def __init__(self, array: np.ndarray) -> None:
+        super().__init__()
+
+        if array.ndim != 2 or array.dtype.itemsize != 1:
+            raise ValueError(f"invalid array for {self.__class__.__name__}: {array.dtype} of shape {array.shape}")
+
+        # attributes
+        self.array = array
+
+    @classmethod
+    def from_lines(cls, data: Data, *, fill: str = " ") -> Grid:
+        """
+        Creates a grid from ascii *data* lines, padding shorter lines with *fill*. Unstripped :py:class:`Lines` of
+        equal length are copied from the mapped file in one go without decoding.
+        """
+        import numpy as np
+
+        if len(fill) != 1:
+            raise ValueError(f"fill must be a single character, got '{fill}'")
+
+        # fast path for lines of equal length that are not changed by stripping
+        if (
+            isinstance(data, Lines) and
+            len(data) and
+            (widths := np.asarray(data._ends) - (starts := np.asarray(data._starts))).min() == widths.max()
+        ):
+            array = np.frombuffer(data._buf, dtype=np.uint8)[starts[:, None] + np.arange(int(widths[0]))]
+            is_whitespace = np.zeros(256, dtype=bool)
+            is_whitespace[list(Lines.whitespace)] = True
+            # stripping would change lines starting or ending with whitespace
+            if not data.strip or not array.shape[1] or not (
+                is_whitespace[array[:, 0]].any() or is_whitespace[array[:, -1]].any()
+            ):
+                if (array >= 128).any():
+                    raise ValueError(f"{cls.__name__} requires ascii characters")
+                return cls(array)
+
+        # generic path
+        lines = list(data)
+        width = max(map(len, lines), default=0)
+        try:
+            raw = "".join(line.ljust(width, fill) for line in lines).encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError(f"{cls.__name__} requires ascii characters")
+        return cls(np.frombuffer(raw, dtype=np.uint8).reshape(len(lines), width).copy())
+
+    def _cast_pos(self, pos: Any) -> tuple[int, int] | None:
+        # returns the position as a tuple, or None when outside the grid
+        if isinstance(pos, Point):
+            i, j = pos.i, pos.j
+        else:
+            tpl = Point._cast_tuple(pos)
+            if isinstance(tpl, Exception):
+                raise tpl
+            i, j = tpl
+        return (i, j) if 0 <= i < self.array.shape[0] and 0 <= j < self.array.shape[1] else None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.n_rows}x{self.n_cols})"
+
+    def __str__(self) -> str:
+        return "\n".join(self.iter_rows())
+
+    def __contains__(self, pos: Any) -> bool:
+        return self._cast_pos(pos) is not None
+
+    def __getitem__(self, pos: Point | Point.InterpretableTypes) -> str:
+        if (tpl := self._cast_pos(pos)) is None:
+            raise IndexError(f"position outside of {self!r}: {pos}")
+        return chr(self.array[tpl])
+
+    def __setitem__(self, pos: Point | Point.InterpretableTypes, char: str) -> None:
+        if (tpl := self._cast_pos(pos)) is None:
+            raise IndexError(f"position outside of {self!r}: {pos}")
+        self.array[tpl] = ord(char)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.array.shape
+
+    @property
+    def n_rows(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def n_cols(self) -> int:
+        return self.array.shape[1]
+
+    def get(self, pos: Point | Point.InterpretableTypes, default: str | None = None) -> str | None:
+        """
+        Returns the character at *pos*, or *default* when it is outside the grid.
+        """
+        tpl = self._cast_pos(pos)
+        return default if tpl is None else chr(self.array[tpl])
+
+    def copy(self) -> Grid:
+        return self.__class__(self.array.copy())
+
+    def iter_rows(self) -> Iterator[str]:
+        for row in self.array:
+            yield row.tobytes().decode("ascii")
+
+    def iter_cols(self) -> Iterator[str]:
+        for col in self.array.T:
+            yield col.tobytes().decode("ascii")
+
+    def mask(self, chars: str) -> np.ndarray:
+        """
+        Returns a boolean array that is *True* for all cells containing any of *chars*.
+        """
+        import numpy as np
+
+        lookup = np.zeros(256, dtype=bool)
+        lookup[list(chars.encode("ascii"))] = True
+        return lookup[self.array]
+
+    def find(self, chars: str) -> PointArray:
+        """
+        Returns the positions of all cells containing any of *chars*, in row-major order.
+        """
+        import numpy as np
+
+        return PointArray(np.argwhere(self.mask(chars)))
+
+    def neighbors(self, pos: Point | Point.InterpretableTypes, *, diagonal: bool = True) -> list[Point]:
+        """
+        Returns the positions of the 8 neighbors of *pos* (or 4 without *diagonal* ones) that are inside the grid.
+        """
+        pos = Point(pos)
+        return [n for d in (self.directions8 if diagonal else self.directions4) if (n := pos + d) in self]
+
+    def neighbor_counts(self, chars: str | np.ndarray, *, diagonal: bool = True) -> np.ndarray:
+        """
+        Returns an integer array with the number of neighbors of each cell that contain any of *chars* (or that are
+        set in a boolean mask of the grid's shape), considering 8 neighbors or 4 without *diagonal* ones.
+        """
+        import numpy as np
+
+        mask = self.mask(chars) if isinstance(chars, str) else chars
+        if mask.shape != self.shape:
+            raise ValueError(f"mask of shape {mask.shape} does not match {self!r}")
+
+        # sum shifted views of the zero-padded mask, which is equivalent to a convolution with the neighbor kernel
+        padded = np.pad(mask.astype(np.uint8), 1)
+        counts = np.zeros(self.shape, dtype=np.uint8)
+        n_rows, n_cols = self.shape
+        for d in (self.directions8 if diagonal else self.directions4):
+            counts += padded[1 + d.i:1 + d.i + n_rows, 1 + d.j:1 + d.j + n_cols]
+        return counts
+
+
+class IntervalSet:
+    """
+    Set of integers stored as sorted, disjoint and non-adjacent inclusive intervals ``(start, stop)``, which are
+    merged upon creation from *intervals* and upon insertion. Membership queries bisect the sorted starts, and
+    batches of values can be queried in a single sweep. Iterating yields the intervals.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = (), /) -> None:
+        super().__init__()
+
+        # sorted starts and stops of merged intervals
+        self._starts: list[int] = []
+        self._stops: list[int] = []
+        for start, stop in sorted(intervals):
+            if start > stop:
+                raise ValueError(f"invalid interval for {self.__class__.__name__}: ({start}, {stop})")
+            if self._stops and start <= self._stops[-1] + 1:  # +1 -> connect adjacent intervals
+                self._stops[-1] = max(self._stops[-1], stop)
+            else:
+                self._starts.append(start)
+                self._stops.append(stop)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._stops)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._stops == other._stops
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect.bisect_right(self._starts, value) - 1
+        return i >= 0 and value <= self._stops[i]
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self.union(other)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self.intersection(other)
+
+    @property
+    def length(self) -> int:
+        """
+        Total number of integers in the set.
+        """
+        return sum(self._stops) - sum(self._starts) + len(self._starts)
+
+    def add(self, start: int, stop: int) -> None:
+        """
+        Inserts the interval from *start* to *stop* (inclusive), merging it with overlapping and adjacent intervals.
+        """
+        if start > stop:
+            raise ValueError(f"invalid interval for {self.__class__.__name__}: ({start}, {stop})")
+
+        # intervals in [lo, hi) overlap or touch the new one
+        lo = bisect.bisect_left(self._stops, start - 1)
+        hi = bisect.bisect_right(self._starts, stop + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            stop = max(stop, self._stops[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._stops[lo:hi] = [stop]
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return self.__class__([*self, *other])
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        # sweep both sorted interval lists, advancing the one that ends first
+        intervals = []
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            stop = min(self._stops[i], other._stops[j])
+            if start <= stop:
+                intervals.append((start, stop))
+            if self._stops[i] < other._stops[j]:
+                i += 1
+            else:
+                j += 1
+        return self.__class__(intervals)
+
+    def contains_many(self, values: Iterable[int], *, is_sorted: bool = False) -> list[bool]:
+        """
+        Returns for each of *values* whether it is in the set, in a single sweep over the values in sorted order and
+        the intervals. Values are sorted first unless *is_sorted* is set.
+        """
+        values = list(values)
+        order = range(len(values)) if is_sorted else sorted(range(len(values)), key=values.__getitem__)
+
+        contained = [False] * len(values)
+        i = 0
+        n_intervals = len(self._starts)
+        if not n_intervals:
+            return contained
+        for idx in order:
+            value = values[idx]
+            # skip intervals ending before the value, bisecting only the remaining ones
+            if self._stops[i] < value:
+                i = bisect.bisect_left(self._stops, value, i + 1)
+                if i == n_intervals:
+                    break
+            contained[idx] = self._starts[i] <= value
+        return contained
+
+    def count(self, values: Iterable[int], *, is_sorted: bool = False) -> int:
+        """
+        Returns the number of *values* in the set (see :py:meth:`contains_many`).
+        """
+        return sum(self.contains_many(values, is_sorted=is_sorted))
+
+
+class DAG:
+    """
+    Directed acyclic graph built from a mapping of nodes to their *successors*, with all node names interned to
+    integer ids in order of appearance and a topological order computed once upon creation. Path counts from a source
+    to all other nodes are then computed in a single sweep over the order. A :py:class:`graphlib.CycleError` listing
+    the nodes of one cycle is raised for cyclic graphs.
+    """
+
+    def __init__(self, successors: Mapping[Any, Iterable[Any]], /) -> None:
+        super().__init__()
+
+        # intern names
+        self.names: list[Any] = []
+        self.ids: dict[Any, int] = {}
+        self.successors: list[list[int]] = []
+        for name, names in successors.items():
+            i = self._intern(name)
+            self.successors[i] = [self._intern(n) for n in names]
+
+        # topological order via kahn's algorithm
+        in_degrees = [0] * len(self.names)
+        for ids in self.successors:
+            for i in ids:
+                in_degrees[i] += 1
+        self.order = [i for i, d in enumerate(in_degrees) if d == 0]
+        for i in self.order:
+            for j in self.successors[i]:
+                in_degrees[j] -= 1
+                if in_degrees[j] == 0:
+                    self.order.append(j)
+        if len(self.order) < len(self.names):
+            raise graphlib.CycleError("graph contains a cycle", self._find_cycle(in_degrees))
+
+        # position of each node in the order
+        self.positions = [0] * len(self.names)
+        for pos, i in enumerate(self.order):
+            self.positions[i] = pos
+
+    def _intern(self, name: Any) -> int:
+        if (i := self.ids.get(name)) is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.successors.append([])
+        return i
+
+    def _find_cycle(self, in_degrees: list[int]) -> list[Any]:
+        # nodes left with incoming edges all have a predecessor that is left as well, so walking predecessors must
+        # eventually revisit a node
+        predecessors: dict[int, int] = {}
+        for i, ids in enumerate(self.successors):
+            if in_degrees[i]:
+                for j in ids:
+                    predecessors[j] = i
+        path = [next(i for i, d in enumerate(in_degrees) if d)]
+        seen = {path[0]: 0}
+        while (i := predecessors[path[-1]]) not in seen:
+            seen[i] = len(path)
+            path.append(i)
+        cycle = path[seen[i]:][::-1]
+        return [self.names[i] for i in cycle + cycle[:1]]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self.ids
+
+    def path_counts(self, source: Any) -> list[int]:
+        """
+        Returns the number of paths from *source* to all nodes, indexed by their ids.
+        """
+        counts = [0] * len(self.names)
+        counts[self.ids[source]] = 1
+        for i in self.order[self.positions[self.ids[source]]:]:
+            if (n := counts[i]):
+                for j in self.successors[i]:
+                    counts[j] += n
+        return counts
+
+    def count_paths(self, source: Any, target: Any) -> int:
+        """
+        Returns the number of paths from *source* to *target*.
+        """
+        if self.positions[self.ids[target]] < self.positions[self.ids[source]]:
+            return 0
+        return self.path_counts(source)[self.ids[target]]
+
+    def count_paths_via(self, waypoints: Sequence[Any]) -> int:
+        """
+        Returns the number of paths passing through all *waypoints* in the given order, i.e., from the first to the
+        last one, as the product of path counts between consecutive waypoints.
+        """
+        count = 1
+        for source, target in zip(waypoints[:-1], waypoints[1:]):
+            if not (count := count * self.count_paths(source, target)):
+                break
+        return count
@@ -0,0 +1,172 @@
+# coding: utf-8
+
+"""
+Command line interface to solve or benchmark all (or selected) days at once. Run as:
+
+.. code-block:: bash
+
+    # solve all days, four at a time
+    python -m aoc2025 --jobs 4
+
+    # benchmark days 8 and 9, store results and compare them to a previous run
+    python -m aoc2025 8 9 --bench --repeat 10 --json bench.json --baseline bench_base.json
+
+    # benchmark day 8 on synthetic inputs of increasing size
+    python -m aoc2025 8 --bench --sizes 1000 2000 4000 --json scaling.json
+
+    # benchmark Point against complex arithmetic on grids of increasing size
+    python -m aoc2025 --bench --bench-points --sizes 100 200
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import argparse
+from typing import Any
+
+from aoc2025 import human_time_diff
+from aoc2025.bench import discover_days, solve_days, benchmark_days, benchmark_points, measurements, compare
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc2025", description=__doc__.strip().split("\n")[0])
+    parser.add_argument("days", nargs="*", type=int, help="days to run, defaults to all discovered days")
+    parser.add_argument("--parts", nargs="+", choices=["a", "b"], help="parts to run, defaults to all")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="number of days to solve in parallel")
+    parser.add_argument("--no-cache", action="store_true", help="do not use cached results when solving")
+    parser.add_argument("--bench", "-b", action="store_true", help="benchmark instead of solving once")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded runs per benchmark")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="measured runs per benchmark")
+    parser.add_argument("--json", help="file to write benchmark results to")
+    parser.add_argument("--baseline", help="benchmark results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown counted as regression")
+    parser.add_argument("--sizes", nargs="+", type=int, help="benchmark synthetic inputs of these sizes instead")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic inputs")
+    parser.add_argument("--bench-points", action="store_true", help="benchmark Point against complex arithmetic")
+    parser.add_argument("--timeout", type=float, help="seconds after which a solution is aborted")
+    parser.add_argument("--max-memory", type=int, help="megabytes a solution may allocate before it is aborted")
+    args = parser.parse_args(argv)
+
+    # lazy import to keep startup fast
+    from tabulate import tabulate  # type: ignore[import-untyped]
+
+    # check arguments
+    days = args.days or discover_days()
+    unknown_days = set(days) - set(discover_days())
+    if unknown_days:
+        parser.error(f"unknown days: {', '.join(map(str, sorted(unknown_days)))}")
+    parts = tuple(args.parts) if args.parts else None
+    if args.bench and args.jobs > 1:
+        parser.error("--jobs cannot be used with --bench as concurrent runs distort timings")
+    if not args.bench and (args.json or args.baseline or args.sizes):
+        parser.error("--json, --baseline and --sizes require --bench")
+    if args.bench_points and (not args.bench or args.days or args.baseline):
+        parser.error("--bench-points requires --bench and cannot be used with days or --baseline")
+    if args.bench and args.no_cache:
+        parser.error("--no-cache has no effect with --bench as benchmarks never use cached results")
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("--timeout must be positive")
+    if args.max_memory is not None and args.max_memory <= 0:
+        parser.error("--max-memory must be positive")
+    if args.max_memory is not None and not sys.platform.startswith("linux"):
+        parser.error(f"--max-memory is only supported on linux, not on {sys.platform}")
+    limits = {"timeout": args.timeout, "max_memory": args.max_memory and args.max_memory * 2**20}
+
+    fmt_time = lambda t: "-" if t is None else human_time_diff(t)
+    fmt_num = lambda x: f"{x:_}" if isinstance(x, (int, float)) else str(x)
+
+    # solve mode
+    if not args.bench:
+        records = solve_days(days, parts, jobs=args.jobs, cache=not args.no_cache, **limits)
+        rows = []
+        for r in records:
+            if r["error"]:
+                status = f"🚫 {r['error']}"
+            elif r["truth"] is None:
+                status = "-"
+            else:
+                status = "✅" if r["result"] == r["truth"] else f"❌ {fmt_num(r['truth'])}"
+            runtime = fmt_time(r["runtime"]) + (" 💾" if r["cached"] else "")
+            rows.append([r["day"], r["part"], fmt_num(r["result"]), status, fmt_time(r["parse"]), runtime])
+        print(tabulate(rows, headers=["day", "part", "result", "truth", "parse", "runtime"]))
+        failed = any(r["error"] or (r["truth"] is not None and r["result"] != r["truth"]) for r in records)
+        return int(failed)
+
+    # point benchmark mode, one grid per size, with the slowdown of Point relative to complex
+    if args.bench_points:
+        doc = {
+            "points": {
+                str(size): benchmark_points(size, warmup=args.warmup, repeat=args.repeat)
+                for size in (args.sizes or [100])
+            },
+        }
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(doc, f, indent=2)
+        rows = []
+        for grid_size, variants in doc["points"].items():
+            for variant, s in variants.items():
+                ratio = s["median"] / variants["complex"]["median"]
+                rows.append([
+                    fmt_num(int(grid_size)),
+                    variant,
+                    s["runs"],
+                    fmt_time(s["min"]),
+                    fmt_time(s["median"]),
+                    fmt_time(s["p95"]),
+                    f"{ratio:.2f}x",
+                ])
+        print(tabulate(rows, headers=["size", "variant", "runs", "min", "median", "p95", "vs. complex"]))
+        return 0
+
+    # benchmark mode
+    doc = benchmark_days(
+        days,
+        parts,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        sizes=args.sizes,
+        seed=args.seed,
+        **limits,
+    )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(doc, f, indent=2)
+
+    # compare to baseline
+    comparison: dict[tuple[int, int | None, str], dict[str, Any]] = {}
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        for entry in compare(doc, baseline, threshold=args.threshold):
+            comparison[(entry["day"], entry["size"], entry["part"])] = entry
+
+    rows = []
+    for (day, size, key), s in measurements(doc).items():
+        row = [day, "-" if size is None else fmt_num(size), key]
+        if "error" in s:
+            rows.append(row + ["-", "-", "-", "-", f"🚫 {s['error']}"])
+            continue
+        row += [s["runs"], fmt_time(s["min"]), fmt_time(s["median"]), fmt_time(s["p95"])]
+        row.append({True: "✅", False: "❌", None: "-"}[s.get("correct")])
+        if args.baseline:
+            if (cmp := comparison.get((day, size, key))) is None:
+                row.append("-")
+            else:
+                row.append(f"{'🐢' if cmp['regression'] else '  '} {cmp['ratio']:.2f}x")
+        rows.append(row)
+    headers = ["day", "size", "part", "runs", "min", "median", "p95", "truth"]
+    if args.baseline:
+        headers.append("vs. baseline")
+    print(tabulate(rows, headers=headers))
+
+    failed = any("error" in s or s.get("correct") is False for s in measurements(doc).values())
+    regressed = any(entry["regression"] for entry in comparison.values())
+    return int(failed or regressed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
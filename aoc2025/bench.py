@@ -0,0 +1,358 @@
+# coding: utf-8
+
+"""
+Discovery, solving and benchmarking of all day modules.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import math
+import time
+import pkgutil
+import platform
+import importlib
+import statistics
+import subprocess
+import tempfile
+import concurrent.futures
+from types import ModuleType
+from typing import Any, Literal
+
+import aoc2025
+from aoc2025 import Solver, Data, Lines, Point, run_solution, result_cache
+from aoc2025.generate import generate
+
+
+def discover_days() -> list[int]:
+    """
+    Returns the sorted numbers of all day modules in the package.
+    """
+    return sorted(
+        int(m.group(1))
+        for mod in pkgutil.iter_modules(aoc2025.__path__)
+        if (m := re.match(r"^day(\d+)$", mod.name))
+    )
+
+
+def load_day(day: int) -> tuple[ModuleType, Solver, Data]:
+    """
+    Imports the module of *day* and returns it together with its solver and input lines.
+    """
+    module = importlib.import_module(f"aoc2025.day{day:02d}")
+    solver: Solver = module.solver
+    return module, solver, solver.load()
+
+
+def solve_day(
+    day: int,
+    parts: tuple[Literal["a", "b"], ...] | None = None,
+    *,
+    cache: bool = True,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Solves *parts* (defaulting to all parts of the puzzle) of *day* once and returns one record per part with the
+    result, the truth and the parsing and solution runtimes. Exceptions are stored in the records rather than raised.
+    With *cache*, results are served from and stored to the :py:data:`~aoc2025.result_cache`. *timeout* and
+    *max_memory* limit each solution call (see :py:func:`~aoc2025.limit`).
+    """
+    module, solver, data = load_day(day)
+    parse = getattr(module, "parse", None)
+
+    records = []
+    for part in parts or solver.parts:
+        if part not in solver.parts:
+            continue
+        record: dict[str, Any] = {
+            "day": day,
+            "part": part,
+            "result": None,
+            "truth": getattr(solver, f"truth_{part}"),
+            "parse": None,
+            "runtime": None,
+            "cached": False,
+            "error": None,
+        }
+        try:
+            cache_key = result_cache.key(module.solution, part, data, parse=parse) if cache else None
+            if cache_key is not None and (hit := result_cache.get(cache_key)) is not None:
+                record["result"], record["runtime"] = hit
+                record["cached"] = True
+                records.append(record)
+                continue
+            inp: Any = data
+            if parse is not None:
+                inp, record["parse"], _ = solver.parse(parse, data)
+            record["result"], record["runtime"] = run_solution(
+                module.solution,
+                part,
+                inp,
+                timeout=timeout,
+                max_memory=max_memory,
+            )
+            if cache_key is not None and record["result"] is not None:
+                result_cache.set(cache_key, record["result"], record["runtime"])
+        except Exception as e:
+            record["error"] = format_error(e)
+        records.append(record)
+
+    return records
+
+
+def solve_days(
+    days: list[int],
+    parts: tuple[Literal["a", "b"], ...] | None = None,
+    *,
+    jobs: int = 1,
+    cache: bool = True,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Solves *days* via :py:func:`solve_day`, using a pool of *jobs* processes when larger than one. Records are
+    returned in the order of *days* regardless of completion order.
+    """
+    kwargs: dict[str, Any] = {"cache": cache, "timeout": timeout, "max_memory": max_memory}
+    if jobs <= 1:
+        return sum((solve_day(day, parts, **kwargs) for day in days), [])
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(solve_day, day, parts, **kwargs) for day in days]
+        return sum((future.result() for future in futures), [])
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    """
+    Returns statistics of runtime *samples* in seconds, with the 95th percentile following the nearest-rank method.
+    """
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)],
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def load_generated(day: int, size: int, seed: int = 0) -> Data:
+    """
+    Returns the lines of a synthetic input for *day* at scale *size* (see :py:mod:`aoc2025.generate`), loaded the same
+    way as real inputs.
+    """
+    _, solver, _ = load_day(day)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write(generate(day, size, seed))
+    try:
+        return Lines(f.name, strip=solver.strip, strip_empty=solver.strip_empty)
+    finally:
+        # the mapping stays valid after removal
+        os.remove(f.name)
+
+
+def benchmark_day(
+    day: int,
+    parts: tuple[Literal["a", "b"], ...] | None = None,
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    data: Data | None = None,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> dict[str, Any]:
+    """
+    Benchmarks *parts* of *day* by discarding *warmup* runs and measuring *repeat* more. The parse step, if any, is
+    measured separately under the key ``"parse"``. Returns a mapping of part to statistics (see :py:func:`summarize`)
+    extended by the result and whether it matches the truth, or to an error message if an exception was raised. When
+    custom *data* is given, results are not compared to the truth. *timeout* and *max_memory* limit each solution
+    call (see :py:func:`~aoc2025.limit`).
+    """
+    module, solver, real_data = load_day(day)
+    parse = getattr(module, "parse", None)
+    if data is None:
+        data = real_data
+
+    stats: dict[str, Any] = {}
+
+    # parsing
+    inp: Any = data
+    if parse is not None:
+        samples = []
+        try:
+            for i in range(warmup + repeat):
+                t1 = time.perf_counter()
+                inp = parse(data)
+                samples.append(time.perf_counter() - t1)
+        except Exception as e:
+            stats["parse"] = {"error": format_error(e)}
+            return stats
+        stats["parse"] = summarize(samples[warmup:])
+
+    # solutions
+    for part in parts or solver.parts:
+        if part not in solver.parts:
+            continue
+        samples = []
+        try:
+            for i in range(warmup + repeat):
+                result, runtime = run_solution(module.solution, part, inp, timeout=timeout, max_memory=max_memory)
+                samples.append(runtime)
+        except Exception as e:
+            stats[part] = {"error": format_error(e)}
+            continue
+        truth = getattr(solver, f"truth_{part}") if data is real_data else None
+        stats[part] = {
+            "result": result,
+            "correct": None if truth is None else result == truth,
+            **summarize(samples[warmup:]),
+        }
+
+    return stats
+
+
+def benchmark_points(size: int = 100, *, warmup: int = 1, repeat: int = 5) -> dict[str, Any]:
+    """
+    Microbenchmark of a grid walk that counts the occupied neighbors of all cells in a *size* x *size* grid, once
+    with :py:class:`~aoc2025.Point` arithmetic and once with ``complex`` numbers as used by day 4 and 9. Returns a
+    mapping of the variant to statistics (see :py:func:`summarize`).
+    """
+    def walk_points() -> int:
+        occupied = {Point(i, j) for i in range(size) for j in range(size) if (i * j) % 3}
+        directions = [Point(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj]
+        return sum(cell + d in occupied for cell in occupied for d in directions)
+
+    def walk_complex() -> int:
+        occupied = {complex(i, j) for i in range(size) for j in range(size) if (i * j) % 3}
+        directions = [complex(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj]
+        return sum(cell + d in occupied for cell in occupied for d in directions)
+
+    stats = {}
+    for name, walk in [("Point", walk_points), ("complex", walk_complex)]:
+        samples = []
+        for i in range(warmup + repeat):
+            t1 = time.perf_counter()
+            result = walk()
+            samples.append(time.perf_counter() - t1)
+        stats[name] = {"result": result, **summarize(samples[warmup:])}
+
+    return stats
+
+
+def benchmark_days(
+    days: list[int],
+    parts: tuple[Literal["a", "b"], ...] | None = None,
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    sizes: list[int] | None = None,
+    seed: int = 0,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> dict[str, Any]:
+    """
+    Benchmarks *days* one after another via :py:func:`benchmark_day` and returns a json-serializable document with
+    meta information about the run and statistics per day. When *sizes* are given, synthetic inputs generated with
+    *seed* are used instead of the real ones, and statistics are stored per day and size under ``"scaling"`` to
+    track runtime against input size. *timeout* and *max_memory* limit each solution call.
+    """
+    doc: dict[str, Any] = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "warmup": warmup,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "days": {},
+        "scaling": {},
+    }
+
+    kwargs: dict[str, Any] = {"warmup": warmup, "repeat": repeat, "timeout": timeout, "max_memory": max_memory}
+    for day in days:
+        if not sizes:
+            doc["days"][str(day)] = benchmark_day(day, parts, **kwargs)
+            continue
+        doc["scaling"][str(day)] = {
+            str(size): benchmark_day(day, parts, data=load_generated(day, size, seed), **kwargs)
+            for size in sizes
+        }
+
+    return doc
+
+
+def measurements(doc: dict[str, Any]) -> dict[tuple[int, int | None, str], dict[str, Any]]:
+    """
+    Flattens the statistics in a benchmark document into a mapping of (day, size, part) to statistics, with the size
+    being *None* for real inputs.
+    """
+    flat: dict[tuple[int, int | None, str], dict[str, Any]] = {}
+    for day, stats in doc.get("days", {}).items():
+        for key, s in stats.items():
+            flat[(int(day), None, key)] = s
+    for day, sized_stats in doc.get("scaling", {}).items():
+        for size, stats in sized_stats.items():
+            for key, s in stats.items():
+                flat[(int(day), int(size), key)] = s
+    return flat
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    threshold: float = 0.1,
+) -> list[dict[str, Any]]:
+    """
+    Compares the benchmark document *current* to *baseline* and returns one entry per measurement present in both.
+    A measurement counts as a regression when its median grew by more than *threshold* (relative) and its fastest
+    run is still slower than the 95th percentile of the baseline, so that noisy but overlapping distributions are
+    not flagged. Failed measurements are skipped.
+    """
+    base_measurements = measurements(baseline)
+    entries = []
+    for (day, size, key), cur in measurements(current).items():
+        if (base := base_measurements.get((day, size, key))) is None or "error" in cur or "error" in base:
+            continue
+        ratio = cur["median"] / base["median"] if base["median"] else math.inf
+        entries.append({
+            "day": day,
+            "size": size,
+            "part": key,
+            "baseline": base["median"],
+            "current": cur["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold and cur["min"] > base["p95"],
+        })
+    return entries
+
+
+def format_error(e: BaseException) -> str:
+    """
+    Returns a one-line description of the exception *e*, including its notes.
+    """
+    msg = f"{e.__class__.__name__}: {e}"
+    if notes := getattr(e, "__notes__", None):
+        msg += f" ({'; '.join(notes)})"
+    return msg
+
+
+def git_commit() -> str | None:
+    """
+    Returns the hash of the current git commit of the repository, or *None* if it cannot be determined.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=aoc2025.this_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
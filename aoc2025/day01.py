@@ -6,10 +6,10 @@ https://adventofcode.com/2025/day/1
 
 from __future__ import annotations
 
-from aoc2025 import Solver, Part
+from aoc2025 import Solver, Part, Data
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
+def solution(data: Data, part: Part) -> int | str | None:
     pos = 50  # current position
     n = 0  # number of times at position 0
 
@@ -39,5 +39,8 @@ def solution(data: list[str], part: Part) -> int | str | None:
     return n
 
 
+solver = Solver(year=2025, day=1, truth_a=1150, truth_b=6_738)
+
+
 if __name__ == "__main__":
-    Solver(year=2025, day=1, truth_a=1150, truth_b=6_738).solve(solution, part="x", example=False, submit=False)
+    solver(solution, part="x", example=False, submit=False)
@@ -6,43 +6,71 @@ https://adventofcode.com/2025/day/2
 
 from __future__ import annotations
 
+import math
 import itertools
 
-from aoc2025 import Solver, Part
+from aoc2025 import Solver, Part, Data
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
-    # parse ranges (no need to merge ranges afterwards, they look rather disjoint)
-    ranges = (d.split("-") for d in data[0].split(","))
+def prime_factors(n: int) -> list[int]:
+    # distinct prime factors of small numbers by trial division
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
 
-    # keep track of invalid ids
-    invalid_ids: set[int] = set()
 
-    # loop
+def repeated_sum(lo: int, hi: int, n_digits: int, block_size: int) -> int:
+    # numbers with n_digits digits that consist of repeated blocks of block_size digits are block * factor with
+    # factor = 1 + 10^block_size + 10^(2 * block_size) + ..., so those in [lo, hi] form an arithmetic sequence
+    factor = sum(10**(block_size * i) for i in range(n_digits // block_size))
+    first = max(-(-lo // factor), 10**(block_size - 1))
+    last = min(hi // factor, 10**block_size - 1)
+    return factor * (first + last) * (last - first + 1) // 2 if first <= last else 0
+
+
+def solution(data: Data, part: Part) -> int | str | None:
+    # parse and merge ranges so that ids in overlapping ranges are only counted once
+    ranges: list[list[int]] = []
+    for start, stop in sorted(tuple(map(int, d.split("-"))) for d in data[0].split(",")):
+        if ranges and start <= ranges[-1][1] + 1:
+            ranges[-1][1] = max(ranges[-1][1], stop)
+        else:
+            ranges.append([start, stop])
+
+    # sum invalid ids per range and number of digits without enumerating them
+    invalid_sum = 0
     for start, stop in ranges:
-        for i in range(int(start), int(stop) + 1):
-            s = str(i)
+        for n_digits in range(len(str(start)), len(str(stop)) + 1):
+            lo = max(start, 10**(n_digits - 1))
+            hi = min(stop, 10**n_digits - 1)
 
-            # part a: check halves
+            # part a: two identical halves
             if part == "a":
-                if len(s) % 2 == 0 and s[:len(s) // 2] == s[len(s) // 2:]:
-                    invalid_ids.add(i)
+                if n_digits % 2 == 0:
+                    invalid_sum += repeated_sum(lo, hi, n_digits, n_digits // 2)
+                continue
+
+            # part b: any number of identical blocks, each of which repeats with a block size of n_digits / p for
+            # some prime factor p of n_digits, with intersections repeating with the gcd of block sizes, so
+            # deduplicate by inclusion-exclusion over subsets of prime factors
+            primes = prime_factors(n_digits)
+            for n in range(1, len(primes) + 1):
+                for subset in itertools.combinations(primes, n):
+                    invalid_sum += (-1)**(n + 1) * repeated_sum(lo, hi, n_digits, n_digits // math.prod(subset))
+
+    return invalid_sum
 
-            # part b: check all possible repeating blocks
-            if part == "b":
-                # check all possible block sizes
-                for block_size in range(1, len(s) // 2 + 1):
-                    # must be even divisor
-                    if len(s) % block_size != 0:
-                        continue
-                    # check if all blocks are identical
-                    if len(set(itertools.batched(s, block_size))) == 1:
-                        invalid_ids.add(i)
-                        break
 
-    # compute and return sum
-    return sum(invalid_ids)
+solver = Solver(year=2025, day=2, truth_a=30_599_400_849, truth_b=46_270_373_595)
 
 
 if __name__ == "__main__":
-    Solver(year=2025, day=2, truth_a=30_599_400_849, truth_b=46_270_373_595).solve(solution, part="x", submit=False)
+    solver(solution, part="x", submit=False)
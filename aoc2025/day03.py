@@ -6,29 +6,74 @@ https://adventofcode.com/2025/day/3
 
 from __future__ import annotations
 
-from aoc2025 import Solver, Part
+import numpy as np
 
+from aoc2025 import Solver, Part, Data, Grid
 
-def solution(data: list[str], part: Part) -> int | str | None:
+
+def largest_subsequence(digits: str, k: int) -> str:
+    # monotonic stack: drop smaller digits before larger ones as long as enough digits remain to select k
+    n_drop = len(digits) - k
+    stack: list[str] = []
+    for d in digits:
+        while n_drop and stack and stack[-1] < d:
+            stack.pop()
+            n_drop -= 1
+        stack.append(d)
+    return "".join(stack[:k])
+
+
+def largest_subsequences(banks: np.ndarray, k: int) -> np.ndarray:
+    # batched version for an (m, n) array of banks with equal lengths that greedily selects the first maximum per
+    # step in all banks at once, within the window that leaves enough digits for the remaining steps, answering
+    # window maximum queries in constant time with a sparse table
+    m, n = banks.shape
+    rows = np.arange(m)
+
+    # keys that order by digit first and by position second, so that the maximum is the first maximal digit
+    keys = banks.astype(np.int32) * (n + 1) + (n - np.arange(n, dtype=np.int32))
+
+    # sparse table with maxima of windows of size 2^level starting at each position
+    n_levels = n.bit_length()
+    table = np.zeros((n_levels, m, n), dtype=np.int32)
+    table[0] = keys
+    for level in range(1, n_levels):
+        half = 1 << (level - 1)
+        table[level, :, :n - 2 * half + 1] = np.maximum(
+            table[level - 1, :, :n - 2 * half + 1],
+            table[level - 1, :, half:n - half + 1],
+        )
+
+    selected = np.empty((m, k), dtype=banks.dtype)
+    starts = np.zeros(m, dtype=np.intp)
+    for i in range(k):
+        # maximum in [start, n - k + i] as the maximum of two overlapping windows of size 2^level
+        stop = n - k + i
+        levels = np.frexp(stop - starts + 1)[1] - 1
+        key = np.maximum(table[levels, rows, starts], table[levels, rows, stop - (1 << levels) + 1])
+        selected[:, i] = key // (n + 1)
+        starts = n - key % (n + 1) + 1
+    return selected
+
+
+def solution(data: Data, part: Part) -> int | str | None:
     n_nums = 2 if part == "a" else 12
 
-    joltages: list[int] = []
-    for line in data:
-        # convert to integers (strings would work, but this is cleaner imho)
-        nums = list(map(int, line))
-        # iteratively find maximum in moving window that take into account a remainder to accommodate all n_nums
-        max_nums: list[int] = []
-        start = 0
-        for i in range(n_nums - 1, -1, -1):
-            # look for maximum between start and len(nums) - i, then shift start to next number
-            i_max = max(range(start, len(nums) - i), key=lambda x: nums[x])
-            max_nums.append(nums[i_max])
-            start = i_max + 1
-        # compute joltage
-        joltages.append(sum(num * 10**(n_nums - i - 1) for i, num in enumerate(max_nums)))
+    # select in chunks of banks at once when their lengths are equal, bounding the memory of sparse tables, and per
+    # bank otherwise
+    if len(set(map(len, data))) == 1:
+        banks = Grid.from_lines(data).array
+        chunk_size = 4096
+        return sum(
+            int(row.tobytes())
+            for offset in range(0, len(banks), chunk_size)
+            for row in largest_subsequences(banks[offset:offset + chunk_size], n_nums)
+        )
+    return sum(int(largest_subsequence(line, n_nums)) for line in data)
+
 
-    return sum(joltages)
+solver = Solver(year=2025, day=3, truth_a=17_100, truth_b=170_418_192_256_861)
 
 
 if __name__ == "__main__":
-    Solver(year=2025, day=3, truth_a=17_100, truth_b=170_418_192_256_861).solve(solution, part="x", submit=False)
+    solver(solution, part="x", submit=False)
@@ -6,43 +6,45 @@ https://adventofcode.com/2025/day/4
 
 from __future__ import annotations
 
-import collections
+import numpy as np
 
-from aoc2025 import Solver, Part
+from aoc2025 import Solver, Part, Data, Grid
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
-    # keep set of role positions
-    rolls = {
-        complex(x, y)
-        for x in range(len(data[0]))
-        for y in range(len(data))
-        if data[y][x] == "@"
-    }
+def solution(data: Data, part: Part) -> int | str | None:
+    # count roll neighbors of all cells at once, padding the grid by one empty cell per side so that flat indices of
+    # neighbors never wrap around rows
+    grid = Grid.from_lines(data)
+    rolls = np.pad(grid.mask("@"), 1).ravel()
+    counts = np.pad(grid.neighbor_counts("@"), 1).ravel()
+    offsets = np.array([d.i * (grid.n_cols + 2) + d.j for d in Grid.directions8])
 
-    # possible directions to check
-    directions = [-1, +1, -1j, +1j, -1 - 1j, -1 + 1j, 1 - 1j, 1 + 1j]
+    # rolls that are accessible initially
+    wave = np.flatnonzero(rolls & (counts < 4))
 
-    # work queue with positions left to check
-    n_accessible = 0
-    q = collections.deque(rolls)
-    while q:
-        r = q.popleft()
-        if r not in rolls:  # protection for part b
-            continue
+    # part a
+    if part == "a":
+        return len(wave)
 
-        # get coordinates of neighbor rolls
-        neighbors = {n for d in directions if (n := r + d) in rolls}
-        if len(neighbors) < 4:
-            n_accessible += 1
+    # part b: peel accessible rolls in waves, since removing rolls only lowers counts, the final set of removed rolls
+    # does not depend on the order, and only neighbors of removed rolls can become accessible in the next wave
+    n_removed = 0
+    while len(wave):
+        n_removed += len(wave)
+        rolls[wave] = False
+        # indices are unique per offset, so that each removed neighbor is subtracted
+        for offset in offsets:
+            counts[wave + offset] -= 1
+        neighbors = (wave[:, None] + offsets).ravel()
+        wave = np.sort(neighbors[rolls[neighbors] & (counts[neighbors] < 4)])
+        # drop duplicates, which is faster than np.unique on sorted indices
+        wave = wave[np.diff(wave, prepend=-1) != 0]
 
-            # addition part b: remove from rolls once accessed and add back neighbors to re-check
-            if part == "b":
-                rolls.remove(r)
-                q.extendleft(neighbors)
+    return n_removed
 
-    return n_accessible
+
+solver = Solver(year=2025, day=4, truth_a=1_537, truth_b=8_707)
 
 
 if __name__ == "__main__":
-    Solver(year=2025, day=4, truth_a=1_537, truth_b=8_707).solve(solution, part="x", example=False, submit=False)
+    solver(solution, part="x", example=False, submit=False)
@@ -6,10 +6,10 @@ https://adventofcode.com/2025/day/5
 
 from __future__ import annotations
 
-from aoc2025 import Solver, Part
+from aoc2025 import Solver, Part, Data, IntervalSet
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
+def solution(data: Data, part: Part) -> int | str | None:
     # parse input
     id_ranges: list[tuple[int, int]] = []
     available_ids: list[int] = []
@@ -20,25 +20,18 @@ def solution(data: list[str], part: Part) -> int | str | None:
             available_ids.append(int(line))
 
     # merge ranges
-    id_ranges.sort(key=lambda tpl: tpl[0])
-    merged_id_ranges = [id_ranges[0]]
-    for start, stop in id_ranges[1:]:
-        last_start, last_stop = merged_id_ranges[-1]
-        if start > last_stop + 1:  # +1 -> connect adjacent ranges
-            merged_id_ranges.append((start, stop))
-        elif stop > last_stop:
-            merged_id_ranges[-1] = (last_start, stop)
-
-    # part a: count occurrences
+    fresh_ids = IntervalSet(id_ranges)
+
+    # part a: count occurrences in a single sweep
     if part == "a":
-        return sum(
-            1 for a in available_ids
-            if any(start <= a <= stop for start, stop in merged_id_ranges)
-        )
+        return fresh_ids.count(available_ids)
 
     # part b: sum extents
-    return sum(stop - start + 1 for start, stop in merged_id_ranges)
+    return fresh_ids.length
+
+
+solver = Solver(year=2025, day=5, truth_a=885, truth_b=348_115_621_205_535)
 
 
 if __name__ == "__main__":
-    Solver(year=2025, day=5, truth_a=885, truth_b=348_115_621_205_535).solve(solution, part="x", submit=False)
+    solver(solution, part="x", submit=False)
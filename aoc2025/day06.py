@@ -6,39 +6,44 @@ https://adventofcode.com/2025/day/6
 
 from __future__ import annotations
 
-import functools
-import operator
-from typing import Callable
-
-from aoc2025 import Solver, Part
-
-
-def solution(data: list[str], part: Part) -> int | str | None:
-    ops_line, num_lines = data[-1], data[:-1]
-
-    # locate all op positions and convert into index ranges for parsing other lines
-    ranges: list[tuple[int, int]] = []
-    for pos in list(i for i, c in enumerate(ops_line) if c in {"+", "*"})[1:] + [len(ops_line) + 1]:
-        ranges.append((ranges[-1][1] + 1 if ranges else 0, pos - 1))
-
-    # parse ops and nums
-    ops: list[Callable] = []
-    nums: list[list[str]] = []
-    for i, (start, end) in enumerate(ranges):
-        ops.append(operator.add if ops_line[start] == "+" else operator.mul)
-        block = [num_line[start:end] for num_line in num_lines]
-        # part b: replace spaces with zeros and transpose
-        if part == "b":
-            block = ["".join(chars).strip() for chars in zip(*block)]
-        nums.append(block)
-
-    # parse problem numbers in proper groups
+import math
+
+from aoc2025 import Solver, Part, Data
+
+
+def solution(data: Data, part: Part) -> int | str | None:
+    # scan the op line once, with each problem spanning all columns up to the next op
+    ops_line = data[-1]
+    starts = [i for i, c in enumerate(ops_line) if c in "+*"]
+    bounds = list(zip(starts, starts[1:] + [None]))
+    is_mul = [ops_line[start] == "*" for start in starts]
+
+    # part a: stream rows into one accumulator per problem
+    if part == "a":
+        accs = [int(mul) for mul in is_mul]
+        for row in data[:-1]:
+            for p, (start, stop) in enumerate(bounds):
+                if not (text := row[start:stop].strip()):
+                    continue
+                accs[p] = accs[p] * int(text) if is_mul[p] else accs[p] + int(text)
+        return sum(accs)
+
+    # part b: stream rows into one accumulator per column, shifting in digits top to bottom and leaving columns
+    # without any digit (i.e., separators and trailing space) at None
+    cols: list[int | None] = []
+    for row in data[:-1]:
+        cols.extend([None] * (len(row) - len(cols)))
+        for c, char in enumerate(row):
+            if char != " ":
+                cols[c] = (cols[c] or 0) * 10 + ord(char) - 48
     return sum(
-        functools.reduce(op, map(int, _nums))
-        for op, _nums in zip(ops, nums)
+        (math.prod if mul else sum)(num for num in cols[start:stop] if num is not None)
+        for (start, stop), mul in zip(bounds, is_mul)
     )
 
 
+solver = Solver(year=2025, day=6, truth_a=4_387_670_995_909, truth_b=9_625_320_374_409, strip=False)
+
+
 if __name__ == "__main__":
-    solver = Solver(year=2025, day=6, truth_a=4_387_670_995_909, truth_b=9_625_320_374_409)
-    solver(solution, strip=False, part="x", submit=False)
+    solver(solution, part="x", submit=False)
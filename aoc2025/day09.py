@@ -6,74 +6,156 @@ https://adventofcode.com/2025/day/9
 
 from __future__ import annotations
 
-import itertools
-import collections
-
-from aoc2025 import Solver, Part
-
+from typing import Callable
+
+import numpy as np
+
+from aoc2025 import Solver, Part, Data, PointArray, span
+
+
+def parse(data: Data) -> PointArray:
+    # red tiles in polygon order
+    return PointArray([tuple(map(int, line.split(","))) for line in data])
+
+
+class CompressedPolygon:
+    """
+    Rectilinear polygon through (n, 2) *tiles*, rasterized onto a compressed grid with one row (column) per distinct y
+    (x) coordinate and one for the gap to the next one. Each cell represents a block of tiles that is either fully
+    inside (including edges) or fully outside the polygon, and 2d prefix sums of outside cells answer whether a
+    rectangle is inside in constant time. Gaps between adjacent coordinates do not contain any tiles and never count
+    as outside. Memory scales with the product of distinct x and y coordinates.
+    """
+
+    def __init__(self, tiles: np.ndarray) -> None:
+        # compressed coordinates of the tiles, with gaps at odd indices
+        self.xs, x_idxs = np.unique(tiles[:, 0], return_inverse=True)
+        self.ys, y_idxs = np.unique(tiles[:, 1], return_inverse=True)
+        self.rows, self.cols = 2 * y_idxs, 2 * x_idxs
+        shape = (2 * len(self.ys) - 1, 2 * len(self.xs) - 1)
+
+        # mark edges as inside and toggle the parity of vertical edges on the half-open row range [lower, upper) so
+        # that crossings at vertices are counted exactly once by rays along rows
+        inside = np.zeros(shape, dtype=bool)
+        parity = np.zeros(shape, dtype=np.uint8)
+        rows, cols = self.rows.tolist(), self.cols.tolist()
+        for r1, c1, r2, c2 in zip(rows, cols, rows[1:] + rows[:1], cols[1:] + cols[:1]):
+            (r1, r2), (c1, c2) = sorted((r1, r2)), sorted((c1, c2))
+            inside[r1:r2 + 1, c1:c2 + 1] = True
+            if c1 == c2:
+                parity[r1:r2, c1] ^= 1
+
+        # cells are inside when an odd number of edges is crossed on the way from the left
+        np.bitwise_xor.accumulate(parity, axis=1, out=parity)
+        inside |= parity.view(bool)
+        del parity
+
+        # outside cells, except for empty gaps
+        outside = np.logical_not(inside, out=inside)
+        outside[1::2][np.diff(self.ys) == 1] = False
+        outside[:, 1::2][:, np.diff(self.xs) == 1] = False
+
+        # prefix sums with a leading row and column of zeros
+        dtype = np.int32 if outside.size < 2**31 else np.int64
+        self.counts = np.zeros((shape[0] + 1, shape[1] + 1), dtype=dtype)
+        np.cumsum(outside, axis=0, dtype=dtype, out=self.counts[1:, 1:])
+        np.cumsum(self.counts[1:, 1:], axis=1, out=self.counts[1:, 1:])
+
+    def contains(self, i: int, js: np.ndarray) -> np.ndarray:
+        """
+        Returns whether the rectangles spanned by tile *i* and each of the tiles *js* are inside the polygon.
+        """
+        r1, r2 = np.minimum(self.rows[i], self.rows[js]), np.maximum(self.rows[i], self.rows[js]) + 1
+        c1, c2 = np.minimum(self.cols[i], self.cols[js]), np.maximum(self.cols[i], self.cols[js]) + 1
+        counts = self.counts
+        return counts[r2, c2] - counts[r1, c2] - counts[r2, c1] + counts[r1, c1] == 0
+
+    def reach(self) -> np.ndarray:
+        """
+        Returns an (n, 4) array with the number of tiles by which the polygon extends from each tile to the left,
+        right, bottom and top along its row and column, which limits inside rectangles with a corner at that tile.
+        """
+        # first and last tile coordinate of each cell
+        def tile_bounds(coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            first, last = np.repeat(coords, 2)[:-1], np.repeat(coords, 2)[1:]
+            first[1::2] += 1
+            last[1::2] -= 1
+            return first, last
+
+        x_first, x_last = tile_bounds(self.xs)
+        y_first, y_last = tile_bounds(self.ys)
+
+        # inside run through a cell given the cumulative outside counts along its row or column, bounded by the
+        # cell after the previous outside cell and the cell before the next one
+        def run(cum: np.ndarray, idx: int) -> tuple[int, int]:
+            n_outside = cum[idx]
+            first = np.searchsorted(cum, n_outside) + 1 if n_outside else 0
+            return first, np.searchsorted(cum, n_outside, side="right") - 1
+
+        reach = np.empty((len(self.rows), 4), dtype=np.int64)
+        counts = self.counts
+        for i, (r, c) in enumerate(zip(self.rows.tolist(), self.cols.tolist())):
+            first, last = run(counts[r + 1, 1:] - counts[r, 1:], c)
+            reach[i, 0], reach[i, 1] = x_first[c] - x_first[first], x_last[last] - x_last[c]
+            first, last = run(counts[1:, c + 1] - counts[1:, c], r)
+            reach[i, 2], reach[i, 3] = y_first[r] - y_first[first], y_last[last] - y_last[r]
+
+        return reach
+
+
+def max_rectangle(
+    tiles: np.ndarray,
+    reach: np.ndarray | None = None,
+    is_valid: Callable[[int, np.ndarray], np.ndarray] | None = None,
+) -> int:
+    """
+    Returns the maximum area of rectangles spanned by two of the (n, 2) *tiles*, optionally only considering those
+    within the per-tile *reach* (see :py:meth:`CompressedPolygon.reach`), defaulting to the bounding box, and for which
+    *is_valid*, called with the index of one tile and the indices of candidate partners, returns *True*. Tiles are
+    visited in decreasing order of the largest area their reach allows, and the search stops once that cannot exceed
+    the best area found so far.
+    """
+    xs, ys = tiles[:, 0], tiles[:, 1]
+    if reach is None:
+        reach = np.stack([xs - xs.min(), xs.max() - xs, ys - ys.min(), ys.max() - ys], axis=1)
+    widths, heights = reach[:, :2] + 1, reach[:, 2:] + 1
+    bounds = (widths[:, :, None] * heights[:, None, :]).max(axis=(1, 2))
+
+    best = 0
+    for i in np.argsort(-bounds, kind="stable").tolist():
+        if bounds[i] <= best:
+            break
+        dxs, dys = xs - xs[i], ys - ys[i]
+        areas = (np.abs(dxs) + 1) * (np.abs(dys) + 1)
+        candidates = np.nonzero(
+            (areas > best) &
+            (-reach[i, 0] <= dxs) & (dxs <= reach[i, 1]) &
+            (-reach[i, 2] <= dys) & (dys <= reach[i, 3]),
+        )[0]
+        if is_valid is not None and len(candidates):
+            candidates = candidates[is_valid(i, candidates)]
+        if len(candidates):
+            best = int(areas[candidates].max())
+
+    return best
+
+
+def solution(tiles: PointArray, part: Part) -> int | str | None:
+    # part a: any rectangle
+    if part == "a":
+        return max_rectangle(tiles.array)
 
-def solution(data: list[str], part: Part) -> int | str | None:
-    red_tiles = [complex(*map(int, line.split(","))) for line in data]
+    # part b: rectangles without any outside tile, checked in constant time via prefix sums on the compressed grid
+    with span("raster"):
+        polygon = CompressedPolygon(tiles.array)
+    with span("reach"):
+        reach = polygon.reach()
+    with span("search"):
+        return max_rectangle(tiles.array, reach, polygon.contains)
 
-    # created sorted list of all square combinations with their area
-    get_area = lambda p, q: int((abs(p.real - q.real) + 1) * (abs(p.imag - q.imag) + 1))
-    squares = [(p, q, get_area(p, q)) for p, q in itertools.combinations(red_tiles, 2)]
-    squares.sort(key=lambda tpl: tpl[2], reverse=True)
 
-    # part a: return maximum
-    if part == "a":
-        return squares[0][2]
-
-    # part b:
-    # - create hashmaps to store positions of all edge tiles, associated to either x or y coordinate
-    # - then, for each area check if there is an intersection with any edge _inside_ (excluding its defining border)
-    # - this assumes that there are no tight turns which is true in the data
-
-    # helper to get corner coordinates given two points
-    def get_corners(p: complex, q: complex) -> tuple[int, int, int, int]:
-        # x/y2 is always the larger value
-        x1, x2 = (int(p.real), int(q.real)) if p.real < q.real else (int(q.real), int(p.real))
-        y1, y2 = (int(p.imag), int(q.imag)) if p.imag < q.imag else (int(q.imag), int(p.imag))
-        return x1, y1, x2, y2
-
-    # scan and store edges as 2-tuples (both sides inclusive)
-    v_edges: dict[int, set[tuple[int, int]]] = collections.defaultdict(set)
-    h_edges: dict[int, set[tuple[int, int]]] = collections.defaultdict(set)
-    for p, q in zip(red_tiles, red_tiles[1:] + red_tiles[:1]):
-        x1, y1, x2, y2 = get_corners(p, q)
-        if y1 == y2:  # horizontal edge
-            h_edges[y1].add((x1, x2))
-        else:  # vertical edge
-            v_edges[x1].add((y1, y2))
-
-    # helper to check for intersection of a single square with any edge
-    def intersects_edge(p: complex, q: complex) -> bool:
-        x1, y1, x2, y2 = get_corners(p, q)
-        # check horizontal edges
-        for ey, edges in h_edges.items():
-            if not (y1 < ey < y2):
-                continue
-            for ex1, ex2 in edges:
-                if ex2 > x1 and ex1 < x2:
-                    return True
-        # check vertical edges
-        for ex, edges in v_edges.items():
-            if not (x1 < ex < x2):
-                continue
-            for ey1, ey2 in edges:
-                if ey2 > y1 and ey1 < y2:
-                    return True
-        # no collision found
-        return False
-
-    # check each square for intersections
-    for p, q, area in squares:
-        if not intersects_edge(p, q):
-            return area
-
-    raise RuntimeError("no solution found")
+solver = Solver(year=2025, day=9, truth_a=4_782_896_435, truth_b=1_540_060_480)
 
 
 if __name__ == "__main__":
-    solver = Solver(year=2025, day=9, truth_a=4_782_896_435, truth_b=1_540_060_480)
-    solver(solution, part="x", submit=False)
+    solver(solution, parse=parse, part="x", submit=False)
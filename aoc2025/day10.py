@@ -6,89 +6,270 @@ https://adventofcode.com/2025/day/10
 
 from __future__ import annotations
 
+import math
 import collections
-import scipy.optimize  # type: ignore[import-untyped]
-
-from aoc2025 import Solver, Part
-
-
-def solution(data: list[str], part: Part) -> int | str | None:
-    sum_presses = 0
-
-    # part a
-    def match_state(target_state: list[int], buttons: list[set[int]]) -> int:
-        # strategy:
-        # - interpret light and button indices as integer bits
-        # - then, presses become xor operations
-        # - use a bfs to find minimal number of presses to reach target state
-        target = sum(1 << i for i in target_state)
-        _buttons = {sum(1 << b for b in button) for button in buttons}
-
-        # bfs with queue, remembering and not re-visiting states
-        # (current state, number of presses to get there, index of last pressed button)
-        q = collections.deque([(0, 0, -1)])
-        visited = {0}
-        while q:
-            state, presses, prev_idx = q.popleft()
-            # check state
-            if state == target:
-                break
-            # shortcut: correct button can be defined, so check if it exists
-            if (target ^ state) in _buttons:
-                presses += 1
-                break
-            # check all buttons, omitting the last pressed one
-            for i, button in enumerate(_buttons):
-                if i == prev_idx:
-                    continue
-                if (new_state := state ^ button) not in visited:
-                    visited.add(new_state)
-                    q.append((new_state, presses + 1, i))
-
-        return presses
-
-    # part b
-    def match_joltages(target_joltages: list[int], buttons: list[set[int]]) -> int:
-        # strategy:
-        # - the number of lights/joltages define the dimension of a vector space
-        # - the target joltages represent a vector in that space
-        # - each button b_i can be seen as a (unit) vector in that space
-        # - we are looking for integer coeffs a_i so that a_i * b_i = target vector (summing over i)
-        # - the constraint is that the sum of a_i is minimal
-        # -> linear optimization problem with integer constraints
-        #    (https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.linprog.html)
-        # -> A is matrix of button vectors, b is target vector, c is effect of each component on target metric (presses)
-
-        # button matrix
-        A = [
-            [int(i in b) for b in buttons]
-            for i in range(len(target_joltages))
-        ]
-        # target vector
-        b = target_joltages
-        # effect of components (all 1, one button press per component)
-        c = [1] * len(buttons)
-
-        res = scipy.optimize.linprog(A_eq=A, b_eq=b, c=c, bounds=(0, None), integrality=1)  # integer variable
-
-        return int(res.fun)
+from collections.abc import Sequence
+
+import numpy as np
+
+from aoc2025 import Solver, Part, Data
+
+
+# target light state as bit mask, buttons as lists of light indices and target joltages
+Machine = tuple[int, list[list[int]], list[int]]
 
+
+def parse(data: Data) -> list[Machine]:
+    machines = []
     for line in data:
-        # parse each line
         parts = line.split(" ")
-        target_state = [i for i, c in enumerate(parts[0][1:-1]) if c == "#"]
-        buttons = [set(map(int, p[1:-1].split(","))) for p in parts[1:-1]]
-        target_joltages = list(map(int, parts[-1][1:-1].split(",")))
+        lights = sum(1 << i for i, c in enumerate(parts[0][1:-1]) if c == "#")
+        buttons = [list(map(int, p[1:-1].split(","))) for p in parts[1:-1]]
+        joltages = list(map(int, parts[-1][1:-1].split(",")))
+        machines.append((lights, buttons, joltages))
+    return machines
+
+
+def eliminate_gf2(target: int, vectors: Sequence[int]) -> tuple[int | None, list[int]]:
+    """
+    Gaussian elimination over GF(2) of *vectors* packed into integer bits. Returns a combination of vectors, as bit
+    mask over their indices, whose xor equals *target*, or *None* if there is none, and a basis of the null space,
+    i.e., combinations whose xor is zero.
+    """
+    # basis vectors with distinct leading bits, sorted in decreasing order, and the combinations that form them
+    basis: list[tuple[int, int]] = []
+    null_space = []
+    for i, vector in enumerate(vectors):
+        combination = 1 << i
+        for basis_vector, basis_combination in basis:
+            # reduce if the leading bit of the basis vector is set
+            if vector ^ basis_vector < vector:
+                vector ^= basis_vector
+                combination ^= basis_combination
+        if vector:
+            basis.append((vector, combination))
+            basis.sort(reverse=True)
+        else:
+            null_space.append(combination)
+
+    # reduce the target the same way
+    combination = 0
+    for basis_vector, basis_combination in basis:
+        if target ^ basis_vector < target:
+            target ^= basis_vector
+            combination ^= basis_combination
+
+    return (None if target else combination), null_space
+
+
+def min_toggle_presses(target: int, buttons: Sequence[int]) -> int:
+    """
+    Returns the minimum number of *buttons*, given as bit masks of toggled lights, to press for reaching the *target*
+    light state from all lights off. All solutions differ by combinations of the null space, which are visited in Gray
+    code order so that each step is a single xor.
+    """
+    combination, null_space = eliminate_gf2(target, buttons)
+    if combination is None:
+        raise ValueError(f"light state {target:b} cannot be reached with buttons {buttons}")
+
+    min_presses = combination.bit_count()
+    for gray in range(1, 1 << len(null_space)):
+        combination ^= null_space[(gray & -gray).bit_length() - 1]
+        min_presses = min(min_presses, combination.bit_count())
+
+    return min_presses
+
+
+def min_toggle_presses_batch(machines: Sequence[tuple[int, Sequence[int]]], *, max_nullity: int = 16) -> list[int]:
+    """
+    Batched version of :py:func:`min_toggle_presses` for multiple pairs of targets and buttons. Machines with the same
+    nullity are enumerated together with numpy, each combination of the null space in one column, except for those
+    with more than *max_nullity* dimensions or 64 buttons, which are enumerated one by one.
+    """
+    results = [0] * len(machines)
+    groups: dict[int, list[tuple[int, int, list[int]]]] = collections.defaultdict(list)
+    for i, (target, buttons) in enumerate(machines):
+        combination, null_space = eliminate_gf2(target, buttons)
+        if combination is None:
+            raise ValueError(f"light state {target:b} cannot be reached with buttons {buttons}")
+        if len(null_space) > max_nullity or len(buttons) > 64:
+            results[i] = min_toggle_presses(target, buttons)
+        else:
+            groups[len(null_space)].append((i, combination, null_space))
+
+    for nullity, group in groups.items():
+        # double the combinations per null space vector
+        combinations = np.array([[combination] for _, combination, _ in group], dtype=np.uint64)
+        for d in range(nullity):
+            null_vectors = np.array([[null_space[d]] for _, _, null_space in group], dtype=np.uint64)
+            combinations = np.concatenate([combinations, combinations ^ null_vectors], axis=1)
+        for (i, _, _), min_presses in zip(group, np.bitwise_count(combinations).min(axis=1).tolist()):
+            results[i] = min_presses
+
+    return results
+
+
+def min_joltage_presses(
+    joltages: Sequence[int],
+    buttons: Sequence[Sequence[int]],
+    *,
+    max_free: int = 3,
+    max_nodes: int = 2_000,
+) -> int | None:
+    """
+    Returns the minimum total number of presses of *buttons*, given as lists of counters they increment by one, to
+    reach the target *joltages* from all zeros. The integer linear system is reduced exactly, with pivot presses
+    expressed by the remaining free ones, which are then searched depth-first within bounds from the joltages,
+    propagated through all rows, and pruned by a lower bound of the total presses. *None* is returned for systems with
+    more than *max_free* free variables or when the search visits more than *max_nodes* nodes.
+    """
+    n_buttons = len(buttons)
+    upper = [min(joltages[i] for i in button) for button in buttons]
+
+    # fraction-free elimination of the augmented matrix into reduced row echelon form
+    rows = [[int(i in button) for button in buttons] + [joltage] for i, joltage in enumerate(joltages)]
+    pivots: list[int] = []
+    for col in range(n_buttons):
+        r = len(pivots)
+        if (pivot := next((k for k in range(r, len(rows)) if rows[k][col]), None)) is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        for k, row in enumerate(rows):
+            if k != r and (factor := row[col]):
+                row = [rows[r][col] * a - factor * b for a, b in zip(row, rows[r])]
+                gcd = math.gcd(*row) or 1
+                rows[k] = [a // gcd for a in row]
+        pivots.append(col)
+    if any(row[-1] for row in rows[len(pivots):]):
+        raise ValueError(f"joltages {joltages} cannot be reached with buttons {buttons}")
+
+    # pivot rows as divisor * x_pivot = rhs - sum(coeffs * x_free), with positive divisors
+    free = [col for col in range(n_buttons) if col not in pivots]
+    if len(free) > max_free:
+        return None
+    divisors, rhs, coeffs = [], [], []
+    for r, col in enumerate(pivots):
+        sign = 1 if rows[r][col] > 0 else -1
+        divisors.append(sign * rows[r][col])
+        rhs.append(sign * rows[r][-1])
+        coeffs.append([sign * rows[r][f] for f in free])
+
+    # total presses scaled by the lcm of divisors, i.e., scale * sum(x) = base + sum(weights * x_free)
+    scale = math.lcm(*divisors)
+    base = sum(scale // d * c for d, c in zip(divisors, rhs))
+    weights = [scale - sum(scale // d * cs[f] for d, cs in zip(divisors, coeffs)) for f in range(len(free))]
+    free_upper = [upper[col] for col in free]
+
+    # smallest contributions of free variables after each depth to rows and weights, taking any value in bounds
+    rest = [range(f + 1, len(free)) for f in range(len(free))]
+    min_rows = [[sum(min(0, cs[g] * free_upper[g]) for g in rest[f]) for cs in coeffs] for f in range(len(free))]
+    min_weights = [sum(min(0, weights[g] * free_upper[g]) for g in rest[f]) for f in range(len(free))]
+
+    best = math.inf
+    n_nodes = 0
+
+    def search(f: int, rhs: list[int], total: int) -> None:
+        nonlocal best, n_nodes
+        n_nodes += 1
+        if n_nodes > max_nodes:
+            return
+
+        # all free variables set, check that pivots are non-negative integers
+        if f == len(free):
+            if all(r >= 0 and r % d == 0 for r, d in zip(rhs, divisors)):
+                best = min(best, total)
+            return
+
+        # bounds from rows, each of which must stay non-negative
+        lo, hi = 0, free_upper[f]
+        for r, cs, min_rest in zip(rhs, coeffs, min_rows[f]):
+            if (c := cs[f]) > 0:
+                hi = min(hi, (r - min_rest) // c)
+            elif c < 0:
+                lo = max(lo, -((r - min_rest) // -c))
+            elif r < min_rest:
+                return
+
+        # visit values in order of increasing total presses, stopping once the lower bound exceeds the best
+        w = weights[f]
+        for value in (range(lo, hi + 1) if w >= 0 else range(hi, lo - 1, -1)):
+            if total + w * value + min_weights[f] >= best:
+                break
+            search(f + 1, [r - cs[f] * value for r, cs in zip(rhs, coeffs)], total + w * value)
+
+    search(0, rhs, base)
+
+    if n_nodes > max_nodes:
+        return None
+    if best == math.inf:
+        raise ValueError(f"joltages {joltages} cannot be reached with buttons {buttons}")
+    return int(best) // scale
+
+
+def min_joltage_presses_milp(
+    machines: Sequence[tuple[Sequence[int], Sequence[Sequence[int]]]],
+    *,
+    batch_size: int = 100,
+) -> list[int]:
+    """
+    Fallback of :py:func:`min_joltage_presses` for multiple pairs of joltages and buttons, solved together in batches
+    of *batch_size* machines as block-diagonal mixed integer linear programs to pay the solver setup only once per
+    batch. Larger batches tend to slow down the branch and bound of the solver.
+    """
+    import scipy.optimize  # type: ignore[import-untyped]
+    import scipy.sparse  # type: ignore[import-untyped]
+
+    if len(machines) > batch_size:
+        return sum((
+            min_joltage_presses_milp(machines[i:i + batch_size], batch_size=batch_size)
+            for i in range(0, len(machines), batch_size)
+        ), [])
+    if not machines:
+        return []
+
+    # one block of rows (joltages) and columns (buttons) per machine
+    entries: list[tuple[int, int]] = []
+    offsets = [0]
+    targets: list[int] = []
+    upper: list[int] = []
+    for joltages, buttons in machines:
+        entries.extend((len(targets) + i, offsets[-1] + j) for j, button in enumerate(buttons) for i in button)
+        offsets.append(offsets[-1] + len(buttons))
+        targets.extend(joltages)
+        upper.extend(min(joltages[i] for i in button) for button in buttons)
+
+    rows, cols = zip(*entries)
+    A = scipy.sparse.csr_array((np.ones(len(entries)), (rows, cols)), shape=(len(targets), offsets[-1]))
+    res = scipy.optimize.milp(
+        c=np.ones(offsets[-1]),
+        integrality=np.ones(offsets[-1]),
+        bounds=scipy.optimize.Bounds(0, upper),
+        constraints=scipy.optimize.LinearConstraint(A, targets, targets),
+    )
+    if not res.success:
+        raise ValueError(f"joltages cannot be reached: {res.message}")
+
+    return np.add.reduceat(np.round(res.x).astype(np.int64), offsets[:-1]).tolist()
+
+
+def solution(machines: list[Machine], part: Part) -> int | str | None:
+    # part a: minimum weight solutions over GF(2), interpreting light and button indices as integer bits
+    if part == "a":
+        return sum(min_toggle_presses_batch([
+            (lights, [sum(1 << i for i in button) for button in buttons])
+            for lights, buttons, _ in machines
+        ]))
+
+    # part b: exact search per machine, with machines exceeding the search budget solved together as one milp
+    presses = [min_joltage_presses(joltages, buttons) for _, buttons, joltages in machines]
+    if (fallback := [i for i, p in enumerate(presses) if p is None]):
+        for i, p in zip(fallback, min_joltage_presses_milp([(machines[i][2], machines[i][1]) for i in fallback])):
+            presses[i] = p
+    return sum(p for p in presses if p is not None)
 
-        # match either state (a) or joltages (b)
-        if part == "a":
-            sum_presses += match_state(target_state, buttons)
-        else:  # part b
-            sum_presses += match_joltages(target_joltages, buttons)
 
-    return sum_presses
+solver = Solver(year=2025, day=10, truth_a=535, truth_b=21_021)
 
 
 if __name__ == "__main__":
-    solver = Solver(year=2025, day=10, truth_a=535, truth_b=21_021)
-    solver(solution, part="x", submit=False)
+    solver(solution, parse=parse, part="x", submit=False)
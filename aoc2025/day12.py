@@ -6,41 +6,219 @@ https://adventofcode.com/2025/day/12
 
 from __future__ import annotations
 
-from aoc2025 import Solver, Part
+import os
+import functools
+import multiprocessing
+from collections.abc import Sequence
 
+from aoc2025 import Solver, Part, Data
 
-Matrix = list[list[int]]
 
+# cells (row, column) of a present shape
+Shape = list[tuple[int, int]]
 
-def solution(data: list[str], part: Part) -> int | str | None:
+# width, height and present counts of a region
+Region = tuple[int, int, list[int]]
+
+
+def parse(data: Data) -> tuple[list[Shape], list[Region]]:
     # parse shapes
-    shapes: list[Matrix] = []
+    shapes: list[Shape] = []
     for i, line in enumerate(data):
         if line.endswith(":"):
             shapes.append([
-                [int(c == "#") for c in data[i + j + 1]]
-                for j in range(3)  # all presents are 3 in height
+                (r, c)
+                for r in range(3)  # all presents are 3 in height
+                for c, char in enumerate(data[i + r + 1])
+                if char == "#"
             ])
 
     # parse regions
-    regions: list[tuple[tuple[int, int], list[int]]] = []
+    regions: list[Region] = []
     for line in data:
         if "x" in line:
             parts = line.split()
-            regions.append((  # type: ignore[arg-type]
-                tuple(map(int, parts[0][:-1].split("x", 1))),  # dimensions
-                list(map(int, parts[1:])),  # present counts
-            ))
+            width, height = map(int, parts[0][:-1].split("x", 1))
+            regions.append((width, height, list(map(int, parts[1:]))))
+
+    return shapes, regions
+
+
+def orientations(shape: Shape) -> list[Shape]:
+    """
+    Returns all distinct rotations and reflections of a *shape*, each shifted to the origin.
+    """
+    variants = set()
+    for _ in range(4):
+        shape = [(c, -r) for r, c in shape]
+        for variant in (shape, [(r, -c) for r, c in shape]):
+            r0, c0 = min(r for r, _ in variant), min(c for _, c in variant)
+            variants.add(tuple(sorted((r - r0, c - c0) for r, c in variant)))
+    return [list(variant) for variant in sorted(variants)]
+
+
+class Packer:
+    """
+    Packing search for presents of *shapes* in a region of *width* and *height*. The region is stored as bitboard with
+    cells in row-major order and one padding column per row, so that shifting a board by a placement offset never wraps
+    around into the next row.
+    """
+
+    def __init__(self, shapes: Sequence[Shape], width: int, height: int) -> None:
+        self.shapes = shapes
+        self.width = width
+        self.height = height
+        self.stride = stride = width + 1
+        self.valid = sum(((1 << width) - 1) << (r * stride) for r in range(height))
+
+        # bit offsets of all orientations per shape, and masks of their placements grouped by their first cell
+        self.offsets: list[list[list[int]]] = []
+        self.placements: list[list[list[int]]] = []
+        for shape in shapes:
+            offsets = []
+            by_cell: list[list[int]] = [[] for _ in range(height * stride)]
+            for orientation in orientations(shape):
+                offsets.append([r * stride + c for r, c in orientation])
+                rows, cols = max(r for r, _ in orientation) + 1, max(c for _, c in orientation) + 1
+                base = sum(1 << (r * stride + c) for r, c in orientation)
+                for r in range(height - rows + 1):
+                    for c in range(width - cols + 1):
+                        mask = base << (r * stride + c)
+                        by_cell[(mask & -mask).bit_length() - 1].append(mask)
+            self.offsets.append(offsets)
+            self.placements.append(by_cell)
+
+    def dead_cells(self, board: int, remaining: Sequence[int]) -> int:
+        """
+        Returns the mask of free cells on a *board* that no placement of the *remaining* presents can cover anymore.
+        For each orientation, the anchors at which all its cells are free are found by and-ing shifted copies of the
+        free cells, and shifting the anchors back yields the cells it can cover.
+        """
+        free = self.valid & ~board
+        coverable = 0
+        for offsets, n in zip(self.offsets, remaining):
+            if not n:
+                continue
+            for orientation in offsets:
+                # anchors are the top left corners of the bounding box, which need not be covered themselves
+                anchors = self.valid
+                for offset in orientation:
+                    if not (anchors := anchors & (free >> offset)):
+                        break
+                else:
+                    for offset in orientation:
+                        coverable |= anchors << offset
+        return free & ~coverable
+
+    def search(self, counts: Sequence[int], *, max_nodes: int | None = None, max_memo: int = 100_000) -> bool | None:
+        """
+        Returns whether presents in the numbers given by *counts* fit into the region without overlaps, or *None* if
+        this remains undecided after visiting *max_nodes* nodes. The search is depth-first over bitboards, either
+        covering the first undecided cell in row-major order with a placement starting there or leaving it empty,
+        which costs one cell of slack, i.e., of the area not needed by presents. Covering cells in a fixed order places
+        identical presents only once instead of in all permutations.
+
+        Each node marks dead cells (see :py:meth:`dead_cells`) as empty right away and is pruned when they exceed the
+        slack. States that failed before, e.g. the same cells covered by different presents, are skipped, keeping up to
+        *max_memo* of them. Presents with the largest share of their count left are tried first, so that no shape is
+        used up early.
+        """
+        slack = self.width * self.height - sum(len(shape) * n for shape, n in zip(self.shapes, counts))
+        if slack < 0:
+            return False
+        filled = ~self.valid
+        totals = [max(n, 1) for n in counts]
+        stack = [(0, tuple(counts), slack)]
+        failed: set[tuple[int, tuple[int, ...]]] = set()
+        n_nodes = 0
+        while stack:
+            board, remaining, slack = stack.pop()
+            if not any(remaining):
+                return True
+            if (board, remaining) in failed:
+                continue
+            if len(failed) >= max_memo:
+                failed.clear()
+            # states are only popped again after all their children failed, so mark them upfront
+            failed.add((board, remaining))
+            if max_nodes is not None and (n_nodes := n_nodes + 1) > max_nodes:
+                return None
+
+            # mark cells that cannot be covered anymore as empty
+            if (n_dead := (dead := self.dead_cells(board, remaining)).bit_count()) > slack:
+                continue
+            board |= dead
+            slack -= n_dead
+
+            # first undecided cell, pushing options in reverse order of preference
+            occupied = board | filled
+            cell = ((occupied + 1) & ~occupied).bit_length() - 1
+            if slack:
+                stack.append((board | (1 << cell), remaining, slack - 1))
+            for s in sorted(range(len(remaining)), key=lambda s: remaining[s] / totals[s]):
+                if (n := remaining[s]):
+                    _remaining = remaining[:s] + (n - 1,) + remaining[s + 1:]
+                    stack.extend(
+                        (board | mask, _remaining, slack)
+                        for mask in self.placements[s][cell]
+                        if not board & mask
+                    )
+
+        return False
+
+
+def quick_fits(shapes: Sequence[Shape], region: Region) -> bool | None:
+    """
+    Returns whether presents of *shapes* in the numbers given by a *region* fit into it according to cheap bounds, or
+    *None* if undecided. Regions are rejected when the presents cover more cells than available and accepted when each
+    present can get a 3x3 block on its own.
+    """
+    width, height, counts = region
+    if sum(len(shape) * n for shape, n in zip(shapes, counts)) > width * height:
+        return False
+    if sum(counts) <= (width // 3) * (height // 3):
+        return True
+    return None
+
+
+def fits(shapes: Sequence[Shape], region: Region, *, max_nodes: int | None = 250_000) -> bool | None:
+    """
+    Returns whether presents of *shapes* in the numbers given by a *region* fit into it without overlaps. Regions not
+    decided by :py:func:`quick_fits` are searched exhaustively with a :py:class:`Packer`, oriented so that rows run
+    along the shorter side to keep the frontier of the search narrow. *None* is returned if the search exceeds
+    *max_nodes*, which bounds the runtime to some seconds per region, or is unbounded when *None*.
+    """
+    if (quick := quick_fits(shapes, region)) is not None:
+        return quick
+
+    width, height, counts = region
+    return Packer(shapes, min(width, height), max(width, height)).search(counts, max_nodes=max_nodes)
+
+
+def solution(parsed: tuple[list[Shape], list[Region]], part: Part) -> int | str | None:
+    shapes, regions = parsed
+
+    # regions are independent, so search those not decided by cheap bounds in parallel, in a pool that is terminated
+    # when the solution is aborted, e.g. by a timeout
+    results = [quick_fits(shapes, region) for region in regions]
+    if (pending := [i for i, result in enumerate(results) if result is None]):
+        with multiprocessing.Pool(min(len(pending), os.cpu_count() or 1)) as pool:
+            searched = pool.map(functools.partial(fits, shapes), [regions[i] for i in pending], chunksize=1)
+        for i, result in zip(pending, searched):
+            results[i] = result
+
+    # report regions exceeding the search budget instead of guessing
+    if (undecided := [i for i, result in enumerate(results) if result is None]):
+        raise RuntimeError(
+            f"{len(undecided)} region(s) undecided within the search budget: " +
+            ", ".join(f"#{i} {regions[i][0]}x{regions[i][1]}" for i in undecided),
+        )
+
+    return sum(map(bool, results))
+
 
-    # lazy assumption / guess: per region, try to just check if the area is in principle large enough
-    # (and yes, that was sufficient ...)
-    shape_counts = [sum(sum(shape, [])) for shape in shapes]
-    return sum(
-        int(sum(c * shape_counts[i] for i, c in enumerate(counts)) <= h * w)
-        for (h, w), counts in regions
-    )
+solver = Solver(year=2025, day=12, truth_a=472, truth_b=None, strip=False, parts=("a",))
 
 
 if __name__ == "__main__":
-    solver = Solver(year=2025, day=12, truth_a=472, truth_b=None)
-    solver(solution, strip=False, part="a", submit=False)
+    solver(solution, parse=parse, part="a", submit=False)
@@ -0,0 +1,268 @@
+# coding: utf-8
+
+"""
+Generators of synthetic puzzle inputs at arbitrary scale, deterministic for a given seed. Run as:
+
+.. code-block:: bash
+
+    # print a day 8 input with 10k junction boxes
+    python -m aoc2025.generate 8 10000 --seed 1
+
+The meaning of the size depends on the puzzle format, e.g. the number of lines, points or ranges, or the side length
+of grids. Answers of generated inputs are not known upfront.
+"""
+
+from __future__ import annotations
+
+import sys
+import math
+import random
+import string
+import argparse
+from typing import Callable
+
+
+def day01(size: int, rng: random.Random) -> str:
+    # rotations
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
+def day02(size: int, rng: random.Random) -> str:
+    # disjoint id ranges, separated by random gaps and in random order
+    ranges = []
+    start = 1
+    for _ in range(size):
+        start += rng.randint(1, 10**6)
+        stop = start + rng.randint(0, 2 * 10**5)
+        ranges.append(f"{start}-{stop}")
+        start = stop + 1
+    rng.shuffle(ranges)
+    return ",".join(ranges)
+
+
+def day03(size: int, rng: random.Random) -> str:
+    # battery banks of 100 digits each
+    return "\n".join("".join(rng.choices("123456789", k=100)) for _ in range(size))
+
+
+def day04(size: int, rng: random.Random) -> str:
+    # square grid with side length size
+    return "\n".join(
+        "".join("@" if rng.random() < 0.6 else "." for _ in range(size))
+        for _ in range(size)
+    )
+
+
+def day05(size: int, rng: random.Random) -> str:
+    # fresh ranges, then available ids
+    max_id = 5 * 10**14
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, max_id)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**12)}")
+    ids = [str(rng.randint(1, max_id)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
+
+
+def day06(size: int, rng: random.Random) -> str:
+    # worksheet with four number rows and one operator row, with numbers in each problem aligned either left or right
+    # and sorted by decreasing length so that digits in each column are contiguous
+    n_rows = 4
+    rows: list[list[str]] = [[] for _ in range(n_rows + 1)]
+    for _ in range(size):
+        nums = sorted((str(rng.randint(1, 10**rng.randint(1, 4) - 1)) for _ in range(n_rows)), key=len, reverse=True)
+        width = len(nums[0])
+        align = rng.choice([str.ljust, str.rjust])
+        for row, num in zip(rows, nums):
+            row.append(align(num, width))
+        rows[-1].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows)
+
+
+def day07(size: int, rng: random.Random) -> str:
+    # manifold with size rows and columns, with splitters in a widening triangle below the start on every other row
+    width = size | 1
+    center = width // 2
+    lines = ["." * center + "S" + "." * center]
+    for i in range(1, size):
+        line = ["."] * width
+        if i % 2 == 0:
+            spread = i // 2 - 1
+            for pos in range(max(center - spread, 1), min(center + spread, width - 2) + 1, 2):
+                if rng.random() < 0.85:
+                    line[pos] = "^"
+        lines.append("".join(line))
+    return "\n".join(lines)
+
+
+def day08(size: int, rng: random.Random) -> str:
+    # distinct 3d junction box positions
+    points: set[tuple[int, int, int]] = set()
+    while len(points) < size:
+        points.add((rng.randint(0, 99_999), rng.randint(0, 99_999), rng.randint(0, 99_999)))
+    return "\n".join(",".join(map(str, p)) for p in points)
+
+
+def day09(size: int, rng: random.Random) -> str:
+    # x-monotone rectilinear polygon with roughly size vertices, built from columns with random top and bottom
+    # heights on even coordinates so that parallel edges are never adjacent
+    n_cols = max(size // 4, 1)
+    max_coord = max(100_000, 4 * n_cols)
+    xs = sorted(2 * x for x in rng.sample(range(max_coord // 2), n_cols + 1))
+
+    def heights(low: int, high: int) -> list[int]:
+        hs = [2 * rng.randint(low, high)]
+        while len(hs) < n_cols:
+            if (h := 2 * rng.randint(low, high)) != hs[-1]:
+                hs.append(h)
+        return hs
+
+    tops = heights(max_coord // 4 + 1, max_coord // 2)
+    bottoms = heights(0, max_coord // 4 - 1)
+    vertices = [(xs[0], tops[0])]
+    for i in range(n_cols):
+        vertices.append((xs[i + 1], tops[i]))
+        if i + 1 < n_cols:
+            vertices.append((xs[i + 1], tops[i + 1]))
+    for i in range(n_cols - 1, -1, -1):
+        vertices.append((xs[i + 1], bottoms[i]))
+        vertices.append((xs[i], bottoms[i]))
+    return "\n".join(f"{x},{y}" for x, y in vertices)
+
+
+def day10(size: int, rng: random.Random) -> str:
+    # machines whose light states and joltages are reachable by construction
+    lines = []
+    for _ in range(size):
+        n_lights = rng.randint(4, 10)
+        buttons = [
+            sorted(rng.sample(range(n_lights), rng.randint(1, n_lights - 1)))
+            for _ in range(rng.randint(3, 13))
+        ]
+        state = [False] * n_lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for i in button:
+                state[i] = not state[i]
+        joltages = [0] * n_lights
+        for button in buttons:
+            presses = rng.randint(0, 30)
+            for i in button:
+                joltages[i] += presses
+        lines.append(" ".join([
+            "[" + "".join("#" if s else "." for s in state) + "]",
+            *("(" + ",".join(map(str, button)) + ")" for button in buttons),
+            "{" + ",".join(map(str, joltages)) + "}",
+        ]))
+    return "\n".join(lines)
+
+
+def day11(size: int, rng: random.Random) -> str:
+    # directed acyclic device graph in which all nodes are in topological order and linked to their successor, with
+    # svr, fft, you and dac placed such that all required paths exist
+    size = max(size, 6)
+    name_len = max(3, math.ceil(math.log(size + 10, 26)))
+    reserved = {"svr", "fft", "you", "dac", "out"}
+    names: set[str] = set()
+    while len(names) < size - 4:
+        if (name := "".join(rng.choices(string.ascii_lowercase, k=name_len))) not in reserved:
+            names.add(name)
+    nodes = sorted(names)
+    rng.shuffle(nodes)
+    nodes[0] = "svr"
+    for name, frac in [("fft", 0.25), ("you", 0.5), ("dac", 0.75)]:
+        nodes.insert(int(frac * len(nodes)), name)
+
+    lines = []
+    for i, node in enumerate(nodes):
+        targets = {nodes[i + 1] if i + 1 < len(nodes) else "out"}
+        for _ in range(rng.randint(0, 2)):
+            j = rng.randint(i + 1, min(i + 20, len(nodes)))
+            targets.add(nodes[j] if j < len(nodes) else "out")
+        lines.append(f"{node}: {' '.join(sorted(targets))}")
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day12(size: int, rng: random.Random) -> str:
+    # six 3x3 present shapes followed by size regions, mostly large ones that either give each present a 3x3 block
+    # of its own or are too small for all cells, and some small ones that are filled tightly, so that all regions
+    # are decided by the cheap bounds or a short search
+    blocks = []
+    shape_areas = []
+    for i in range(6):
+        cells: list[tuple[int, int]] = []
+        while len(cells) < 5:
+            cells = [(r, c) for r in range(3) for c in range(3) if rng.random() < 0.75]
+        shape_areas.append(len(cells))
+        blocks.append(f"{i}:\n" + "\n".join(
+            "".join("#" if (r, c) in cells else "." for c in range(3))
+            for r in range(3)
+        ))
+    regions = []
+    for _ in range(size):
+        counts = [0] * 6
+        if rng.random() < 0.1:
+            w, h = rng.randint(4, 7), rng.randint(4, 7)
+            fill = rng.uniform(0.8, 1.0) * w * h
+            while sum(c * a for c, a in zip(counts, shape_areas)) < fill:
+                counts[rng.randrange(6)] += 1
+        elif rng.random() < 0.5:
+            w, h = rng.randint(35, 50), rng.randint(35, 50)
+            for _ in range(int(rng.uniform(0.7, 1.0) * (w // 3) * (h // 3))):
+                counts[rng.randrange(6)] += 1
+        else:
+            w, h = rng.randint(35, 50), rng.randint(35, 50)
+            fill = rng.uniform(1.0, 1.1) * w * h
+            while sum(c * a for c, a in zip(counts, shape_areas)) <= fill:
+                counts[rng.randrange(6)] += 1
+        regions.append(f"{w}x{h}: {' '.join(map(str, counts))}")
+    return "\n\n".join(blocks) + "\n\n" + "\n".join(regions)
+
+
+generators: dict[int, Callable[[int, random.Random], str]] = {
+    1: day01,
+    2: day02,
+    3: day03,
+    4: day04,
+    5: day05,
+    6: day06,
+    7: day07,
+    8: day08,
+    9: day09,
+    10: day10,
+    11: day11,
+    12: day12,
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """
+    Returns a synthetic input for *day* at scale *size*, deterministic for a given *seed*.
+    """
+    if day not in generators:
+        raise ValueError(f"no input generator for day {day}")
+    if size < 1:
+        raise ValueError(f"size must be positive, got {size}")
+    return generators[day](size, random.Random(f"{day}-{size}-{seed}")) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc2025.generate", description=__doc__.strip().split("\n")[0])
+    parser.add_argument("day", type=int, choices=sorted(generators), help="day to generate an input for")
+    parser.add_argument("size", type=int, help="scale of the input, meaning depends on the day")
+    parser.add_argument("--seed", "-s", type=int, default=0, help="random seed")
+    parser.add_argument("--output", "-o", help="file to write to instead of stdout")
+    args = parser.parse_args(argv)
+
+    data = generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(data)
+    else:
+        sys.stdout.write(data)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
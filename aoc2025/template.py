@@ -6,15 +6,17 @@ https://adventofcode.com/2025/day/0
 
 from __future__ import annotations
 
-from aoc2025 import Solver, Part
+from aoc2025 import Solver, Part, Data
 
 
-def solution(data: list[str], part: Part) -> int | str | None:
+def solution(data: Data, part: Part) -> int | str | None:
     return None
 
 
+solver = Solver(year=2025, day=0, truth_a=None, truth_b=None)
+
+
 if __name__ == "__main__":
-    solver = Solver(year=2025, day=0, truth_a=None, truth_b=None)
     solver(solution, part="a", example=True, submit=False)
     solver(solution, part="a", example=False, submit=True)
     # solver(solution, part="b", example=True, submit=False)
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+"""
+Tests of path counts in directed acyclic graphs against enumeration, and of cycle reporting.
+"""
+
+from __future__ import annotations
+
+import random
+import graphlib
+import unittest
+from typing import Any
+
+from aoc2025 import DAG
+
+
+def random_dag(rng: random.Random, n: int, p: float) -> dict[str, list[str]]:
+    # edges only lead to nodes later in a shuffled order, some nodes without successors are left out as keys
+    names = [f"n{i}" for i in range(n)]
+    rng.shuffle(names)
+    successors = {}
+    for i, name in enumerate(names):
+        targets = [other for other in names[i + 1:] if rng.random() < p]
+        if targets or rng.random() < 0.5:
+            successors[name] = targets
+    return successors
+
+
+def enumerate_paths(successors: dict[str, list[str]], source: str, target: str) -> int:
+    if source == target:
+        return 1
+    return sum(enumerate_paths(successors, node, target) for node in successors.get(source, []))
+
+
+class DAGTest(unittest.TestCase):
+
+    def assert_cycle(self, successors: dict[Any, list[Any]]) -> None:
+        with self.assertRaises(graphlib.CycleError) as ctx:
+            DAG(successors)
+        # the reported nodes form a closed walk along existing edges
+        cycle = ctx.exception.args[1]
+        self.assertGreater(len(cycle), 1)
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(len(set(cycle)), len(cycle) - 1)
+        for a, b in zip(cycle[:-1], cycle[1:]):
+            self.assertIn(b, successors[a])
+
+    def test_path_counts(self) -> None:
+        rng = random.Random(0)
+        for n in range(1, 12):
+            successors = random_dag(rng, n, 0.4)
+            dag = DAG(successors)
+            names = sorted(dag.names)
+            for source in names:
+                for target in names:
+                    expected = enumerate_paths(successors, source, target)
+                    self.assertEqual(dag.count_paths(source, target), expected, f"{successors} {source} {target}")
+                    self.assertEqual(dag.path_counts(source)[dag.ids[target]], expected)
+            if len(names) >= 3:
+                waypoints = rng.sample(names, 3)
+                expected = 1
+                for source, target in zip(waypoints[:-1], waypoints[1:]):
+                    expected *= enumerate_paths(successors, source, target)
+                self.assertEqual(dag.count_paths_via(waypoints), expected)
+
+    def test_order(self) -> None:
+        dag = DAG({"a": ["b", "c"], "b": ["d"], "c": ["d"], "e": []})
+        self.assertEqual(len(dag), 5)
+        self.assertIn("d", dag)
+        self.assertNotIn("x", dag)
+        for i, ids in enumerate(dag.successors):
+            for j in ids:
+                self.assertLess(dag.positions[i], dag.positions[j])
+        self.assertEqual(dag.count_paths("a", "d"), 2)
+        self.assertEqual(dag.count_paths("d", "a"), 0)
+        self.assertEqual(dag.count_paths_via(["a", "b", "d"]), 1)
+
+    def test_cycles(self) -> None:
+        self.assert_cycle({"a": ["a"]})
+        self.assert_cycle({"a": ["b"], "b": ["a"]})
+        # a cycle downstream of acyclic nodes, with nodes hanging off it
+        self.assert_cycle({"s": ["a", "x"], "a": ["b"], "b": ["c", "y"], "c": ["a"], "x": ["y"], "y": []})
+        # random graphs with one back edge added
+        rng = random.Random(1)
+        for _ in range(50):
+            successors = random_dag(rng, 8, 0.3)
+            edges = [(a, b) for a, targets in successors.items() for b in targets]
+            if not edges:
+                continue
+            a, b = rng.choice(edges)
+            successors.setdefault(b, []).append(a)
+            self.assert_cycle(successors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# coding: utf-8
+
+"""
+Tests of the day 10 joltage search against integer programs solved by scipy.
+"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from collections.abc import Sequence
+
+import numpy as np
+import scipy.optimize  # type: ignore[import-untyped]
+
+from aoc2025 import data_dir
+from aoc2025.day10 import Machine, parse, solver, min_joltage_presses, min_joltage_presses_milp
+from aoc2025.generate import generate
+
+
+def reference_presses(joltages: Sequence[int], buttons: Sequence[Sequence[int]]) -> int:
+    # minimize the total presses with linprog, restricted to integers
+    A = np.array([[int(i in button) for button in buttons] for i in range(len(joltages))])
+    res = scipy.optimize.linprog(
+        c=np.ones(len(buttons)),
+        A_eq=A,
+        b_eq=joltages,
+        bounds=(0, None),
+        integrality=1,
+    )
+    assert res.success, res.message
+    return int(round(res.fun))
+
+
+class JoltagePressesTest(unittest.TestCase):
+
+    def check(self, machines: list[Machine]) -> None:
+        fallback = []
+        for _, buttons, joltages in machines:
+            presses = min_joltage_presses(joltages, buttons)
+            if presses is None:
+                fallback.append((joltages, buttons))
+                continue
+            self.assertEqual(presses, reference_presses(joltages, buttons), f"{joltages} {buttons}")
+
+        # machines exceeding the search budget are solved by the batched milp fallback
+        for (joltages, buttons), presses in zip(fallback, min_joltage_presses_milp(fallback, batch_size=7)):
+            self.assertEqual(presses, reference_presses(joltages, buttons), f"{joltages} {buttons}")
+
+    @unittest.skipUnless(os.path.exists(os.path.join(data_dir, "data10.txt")), "input of day 10 missing")
+    def test_real_input(self) -> None:
+        self.check(parse(solver.load()))
+
+    def test_generated_inputs(self) -> None:
+        for seed in range(3):
+            self.check(parse(generate(10, 100, seed).splitlines()))
+
+    def test_unreachable(self) -> None:
+        with self.assertRaises(ValueError):
+            min_joltage_presses([1, 2], [[0, 1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
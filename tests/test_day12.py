@@ -0,0 +1,111 @@
+# coding: utf-8
+
+"""
+Tests of the day 12 packing search against a brute force on small, tightly filled regions.
+"""
+
+from __future__ import annotations
+
+import random
+import unittest
+from collections.abc import Sequence
+
+from aoc2025.day12 import Shape, Region, parse, orientations, fits, quick_fits, solution, Packer
+from aoc2025.generate import generate
+
+
+def brute_force(shapes: Sequence[Shape], region: Region) -> bool:
+    # place presents one after another at any position and orientation, identical presents in increasing order
+    width, height, counts = region
+    options = []
+    for shape in shapes:
+        cells = set()
+        for orientation in orientations(shape):
+            for r in range(height):
+                for c in range(width):
+                    placed = frozenset((r + dr, c + dc) for dr, dc in orientation)
+                    if all(i < height and j < width for i, j in placed):
+                        cells.add(placed)
+        options.append(sorted(cells, key=sorted))
+    presents = [s for s, n in enumerate(counts) for _ in range(n)]
+
+    def place(k: int, occupied: frozenset, first: int) -> bool:
+        if k == len(presents):
+            return True
+        s = presents[k]
+        for i in range(first, len(options[s])):
+            if not occupied & options[s][i]:
+                next_first = i + 1 if k + 1 < len(presents) and presents[k + 1] == s else 0
+                if place(k + 1, occupied | options[s][i], next_first):
+                    return True
+        return False
+
+    return place(0, frozenset(), 0)
+
+
+def tight_regions(seed: int, n: int) -> tuple[list[Shape], list[Region]]:
+    # small regions with generated shapes whose presents cover 80% to 100% of the area
+    shapes, _ = parse(generate(12, 1, seed).splitlines())
+    rng = random.Random(seed)
+    regions: list[Region] = []
+    while len(regions) < n:
+        width, height = rng.randint(4, 6), rng.randint(4, 6)
+        counts = [0] * len(shapes)
+        while True:
+            s = rng.randrange(len(shapes))
+            if sum(len(shape) * c for shape, c in zip(shapes, counts)) + len(shapes[s]) > width * height:
+                break
+            counts[s] += 1
+        # keep the brute force fast with at most five presents
+        if sum(counts) <= 5 and sum(len(shape) * c for shape, c in zip(shapes, counts)) >= 0.8 * width * height:
+            regions.append((width, height, counts))
+    return shapes, regions
+
+
+class PackingTest(unittest.TestCase):
+
+    def test_tight_regions(self) -> None:
+        n_fit = n_total = 0
+        for seed in range(8):
+            shapes, regions = tight_regions(seed, 6)
+            for region in regions:
+                expected = brute_force(shapes, region)
+                self.assertEqual(fits(shapes, region), expected, f"seed {seed}, region {region}")
+                # the search alone, in both orientations of the region, bypassing the cheap bounds
+                width, height, counts = region
+                self.assertEqual(Packer(shapes, width, height).search(counts), expected)
+                self.assertEqual(Packer(shapes, height, width).search(counts), expected)
+                n_fit += expected
+                n_total += 1
+
+        # make sure both outcomes are covered
+        self.assertGreater(n_fit, 0)
+        self.assertLess(n_fit, n_total)
+
+    def test_generated_inputs(self) -> None:
+        # all generated regions are decided within the default search budget
+        for seed in range(3):
+            shapes, regions = parse(generate(12, 200, seed).splitlines())
+            results = [fits(shapes, region) for region in regions]
+            self.assertNotIn(None, results)
+            self.assertEqual(solution((shapes, regions), "a"), sum(map(bool, results)))
+
+    def test_search_budget(self) -> None:
+        # regions not decided within the budget are reported as such
+        shapes, regions = tight_regions(0, 6)
+        region = next(region for region in regions if quick_fits(shapes, region) is None)
+        self.assertIsNone(fits(shapes, region, max_nodes=1))
+        self.assertIsNotNone(fits(shapes, region))
+
+    def test_dead_cells(self) -> None:
+        # with the top left cell taken, a 3x3 square can only cover the right three columns of a 4x3 region
+        square = [(r, c) for r in range(3) for c in range(3)]
+        packer = Packer([square], 4, 3)
+        self.assertEqual(packer.dead_cells(0, [1]), 0)
+        self.assertEqual(packer.dead_cells(0b1, [1]), (1 << 5) | (1 << 10))
+        self.assertFalse(packer.search([2]))
+        self.assertTrue(packer.search([1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
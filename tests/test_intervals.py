@@ -0,0 +1,81 @@
+# coding: utf-8
+
+"""
+Tests of interval sets against plain sets of integers.
+"""
+
+from __future__ import annotations
+
+import random
+import unittest
+
+from aoc2025 import IntervalSet
+
+
+def random_intervals(rng: random.Random, n: int, span: int) -> list[tuple[int, int]]:
+    # short intervals in a small range, so that overlapping, adjacent and nested ones are common
+    intervals = []
+    for _ in range(n):
+        start = rng.randint(-span, span)
+        intervals.append((start, start + rng.randint(0, 4)))
+    return intervals
+
+
+def to_set(intervals: list[tuple[int, int]]) -> set[int]:
+    return {v for start, stop in intervals for v in range(start, stop + 1)}
+
+
+class IntervalSetTest(unittest.TestCase):
+
+    def check(self, intervals: IntervalSet, expected: set[int]) -> None:
+        # disjoint, sorted and non-adjacent intervals covering exactly the expected values
+        pairs = list(intervals)
+        self.assertEqual(to_set(pairs), expected)
+        self.assertEqual(intervals.length, len(expected))
+        self.assertEqual(len(intervals), len(pairs))
+        for (_, stop), (start, _) in zip(pairs[:-1], pairs[1:]):
+            self.assertGreater(start, stop + 1)
+
+    def test_merge(self) -> None:
+        self.assertEqual(list(IntervalSet([(5, 7), (1, 2), (3, 4), (10, 12), (11, 11)])), [(1, 7), (10, 12)])
+        self.assertEqual(list(IntervalSet([(1, 2), (4, 5)])), [(1, 2), (4, 5)])
+        self.assertEqual(list(IntervalSet()), [])
+        self.assertFalse(IntervalSet())
+        with self.assertRaises(ValueError):
+            IntervalSet([(2, 1)])
+
+    def test_random(self) -> None:
+        rng = random.Random(0)
+        for _ in range(200):
+            intervals = random_intervals(rng, rng.randint(0, 12), 20)
+            others = random_intervals(rng, rng.randint(0, 12), 20)
+            expected, other_expected = to_set(intervals), to_set(others)
+            iset, other = IntervalSet(intervals), IntervalSet(others)
+            self.check(iset, expected)
+
+            # membership, one by one and in batches
+            values = [rng.randint(-30, 30) for _ in range(40)]
+            self.assertEqual([v in iset for v in values], [v in expected for v in values])
+            self.assertEqual(iset.contains_many(values), [v in expected for v in values])
+            values.sort()
+            self.assertEqual(iset.contains_many(values, is_sorted=True), [v in expected for v in values])
+            self.assertEqual(iset.count(values), sum(v in expected for v in values))
+
+            # set operations
+            self.check(iset | other, expected | other_expected)
+            self.check(iset & other, expected & other_expected)
+            self.assertEqual(iset | other, IntervalSet(intervals + others))
+
+            # insertion, one interval after another
+            incremental = IntervalSet()
+            for start, stop in intervals:
+                incremental.add(start, stop)
+            self.assertEqual(incremental, iset)
+
+    def test_add_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            IntervalSet().add(3, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
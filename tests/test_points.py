@@ -0,0 +1,103 @@
+# coding: utf-8
+
+"""
+Tests of the closest pairs and spanning trees of point arrays against brute force, with ties and degenerate points.
+"""
+
+from __future__ import annotations
+
+import random
+import itertools
+import unittest
+
+from aoc2025 import PointArray, Point3Array
+
+
+def brute_force_pairs(points: list[tuple[int, ...]]) -> list[tuple[int, int, int]]:
+    # all pairs sorted by squared distance and then indices
+    pairs = [
+        (sum((a - b)**2 for a, b in zip(points[i], points[j])), i, j)
+        for i, j in itertools.combinations(range(len(points)), 2)
+    ]
+    return [(i, j, dist2) for dist2, i, j in sorted(pairs)]
+
+
+def brute_force_tree(points: list[tuple[int, ...]]) -> list[int]:
+    # squared distances of the edges of a minimum spanning tree found with prim's algorithm
+    def dist2(i: int, j: int) -> int:
+        return sum((a - b)**2 for a, b in zip(points[i], points[j]))
+
+    best = {i: dist2(0, i) for i in range(1, len(points))}
+    weights = []
+    while best:
+        i = min(best, key=best.__getitem__)
+        weights.append(best.pop(i))
+        for j in best:
+            best[j] = min(best[j], dist2(i, j))
+    return weights
+
+
+def random_points(rng: random.Random, n: int, n_dims: int, span: int, flat: bool = False) -> list[tuple[int, ...]]:
+    # small coordinate ranges cause many equal distances and duplicate points, and flat points lie in a plane
+    return [
+        tuple(0 if flat and d == n_dims - 1 else rng.randint(0, span) for d in range(n_dims))
+        for _ in range(n)
+    ]
+
+
+class PointArrayTest(unittest.TestCase):
+
+    def point_sets(self) -> list[tuple[type, list[tuple[int, ...]]]]:
+        rng = random.Random(0)
+        sets: list[tuple[type, list[tuple[int, ...]]]] = [
+            (Point3Array, [(1, 1, 1)] * 5),
+            (Point3Array, [(0, 0, 0), (0, 0, 3)]),
+            (PointArray, [(i, 0) for i in range(6)]),
+            (PointArray, [(0, 0), (1, 0), (0, 1), (1, 1), (0, 0), (1, 1)]),
+        ]
+        for n, span in [(2, 3), (5, 2), (12, 3), (30, 4), (60, 10)]:
+            sets.append((PointArray, random_points(rng, n, 2, span)))
+            sets.append((Point3Array, random_points(rng, n, 3, span)))
+            sets.append((Point3Array, random_points(rng, n, 3, span, flat=True)))
+        return sets
+
+    def test_closest_pairs(self) -> None:
+        for cls, points in self.point_sets():
+            expected = brute_force_pairs(points)
+            for k in (1, 2, 3, 8):
+                pairs = list(cls(points).closest_pairs(k=k))
+                self.assertEqual(pairs, expected, f"{cls.__name__}({points}), k={k}")
+
+    def test_closest_pairs_prefix(self) -> None:
+        points = random_points(random.Random(1), 200, 3, 6)
+        expected = brute_force_pairs(points)[:50]
+        self.assertEqual(list(itertools.islice(Point3Array(points).closest_pairs(k=1), 50)), expected)
+
+    def test_closest_pairs_single(self) -> None:
+        self.assertEqual(list(Point3Array([(1, 2, 3)]).closest_pairs()), [])
+
+    def test_spanning_tree(self) -> None:
+        for cls, points in self.point_sets():
+            edges = cls(points).spanning_tree()
+            msg = f"{cls.__name__}({points})"
+            weights = sorted(brute_force_tree(points))
+
+            # same total weight and bottleneck as any minimum spanning tree
+            self.assertEqual(sorted(dist2 for _, _, dist2 in edges), weights, msg)
+            self.assertEqual(max((dist2 for _, _, dist2 in edges), default=0), max(weights, default=0), msg)
+
+            # sorted edges with correct distances that connect all points
+            self.assertEqual(edges, sorted(edges, key=lambda e: (e[2], e[0], e[1])), msg)
+            components = {i: {i} for i in range(len(points))}
+            for i, j, dist2 in edges:
+                self.assertLess(i, j, msg)
+                self.assertEqual(dist2, sum((a - b)**2 for a, b in zip(points[i], points[j])), msg)
+                self.assertIsNot(components[i], components[j], msg)
+                merged = components[i] | components[j]
+                for m in merged:
+                    components[m] = merged
+            self.assertEqual(len(components[0]), len(points), msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# coding: utf-8
+
+"""
+Tests of import costs and of staying offline for local runs.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import subprocess
+
+from aoc2025 import data_dir
+
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(*args: str, env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
+    # allow bytecode to be written so that repeated runs measure warm imports
+    _env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    _env.update(env or {})
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=repo_dir,
+        env=_env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class StartupTest(unittest.TestCase):
+
+    # budget in seconds for importing a day, and for importing and solving day 1, measured by the interpreter itself
+    import_budget = 0.1
+
+    def import_times(self, module: str) -> dict[str, float]:
+        # warm up once to compile bytecode, then parse the cumulative time per module
+        run_python("-c", f"import {module}")
+        stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+        times = {}
+        for line in stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, name = line.split("|")
+                if cumulative.strip().isdigit():
+                    times[name.strip()] = int(cumulative) * 1e-6
+        return times
+
+    def test_import_day(self) -> None:
+        times = self.import_times("aoc2025.day01")
+        for module in ("aocd", "requests", "numpy"):
+            self.assertNotIn(module, times)
+        self.assertLess(times["aoc2025.day01"], self.import_budget)
+
+    @unittest.skipUnless(os.path.exists(os.path.join(data_dir, "data01.txt")), "input of day 1 missing")
+    def test_solve_day(self) -> None:
+        # same as "python -m aoc2025.day01", timed without the interpreter startup, printing the time and whether
+        # heavy modules were imported on the last line
+        code = (
+            "import sys, time, runpy\n"
+            "t = time.perf_counter()\n"
+            "runpy.run_module('aoc2025.day01', run_name='__main__')\n"
+            "print(time.perf_counter() - t, *(m in sys.modules for m in ('aocd', 'requests', 'numpy')))\n"
+        )
+        run_python("-c", code)
+        duration, *imported = run_python("-c", code).stdout.splitlines()[-1].split()
+        self.assertEqual(imported, ["False"] * 3)
+        self.assertLess(float(duration), self.import_budget)
+
+    @unittest.skipUnless(os.path.exists(os.path.join(data_dir, "data01.txt")), "input of day 1 missing")
+    def test_solve_offline_with_session(self) -> None:
+        # a session must not trigger any remote access as long as nothing is fetched or submitted
+        code = (
+            "import sys\n"
+            "from aoc2025 import day01\n"
+            "day01.solver(day01.solution, part='x', submit=False)\n"
+            "assert 'aocd' not in sys.modules, 'aocd imported'\n"
+        )
+        run_python("-c", code, env={"AOC_SESSION": "invalid"})
+
+
+if __name__ == "__main__":
+    unittest.main()